@@ -21,6 +21,7 @@ from goal_tracker import GoalTracker
 from values import ValueSystem
 from dreams import generate_and_log_dream
 from dialogue import generate_internal_thought, log_internal_thought
+from logger import read_log_tail
 from thread_utils import TaskRunner
 from activity_state import set_activity, get_activity
 
@@ -711,9 +712,7 @@ def get_recent_dreams(count: int = 5):
 def get_introspection_feed():
     """Get introspection feed for GUI display"""
     try:
-        with open("logs/introspection.log", "r") as f:
-            lines = f.readlines()
-        return lines[-20:] if lines else []
+        return [line + "\n" for line in read_log_tail("logs/introspection.log", 20)]
     except Exception as e:
         print(f"Error reading introspection: {e}")
         return []
@@ -721,9 +720,7 @@ def get_introspection_feed():
 def get_internal_voice():
     """Get internal voice log for GUI display"""
     try:
-        with open("logs/internal_voice.log", "r") as f:
-            lines = f.readlines()
-        return lines[-10:] if lines else []
+        return [line + "\n" for line in read_log_tail("logs/internal_voice.log", 10)]
     except Exception as e:
         print(f"Error reading internal voice: {e}")
         return []
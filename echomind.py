@@ -1,4 +1,4 @@
-from input_processor import InputSignal, InputRouter
+from input_processor import InputSignal, InputRouter, Modality
 from cognition import launch_background_cognition
 from mind_gui import launch_dashboard
 
@@ -9,7 +9,7 @@ def handle_text_input(signal):
     print("[Input] EchoMind received:", signal.data)
     # You can expand this logic or route it elsewhere if needed
 
-input_router.register("text", handle_text_input)
+input_router.register(Modality.TEXT, handle_text_input)
 
 if __name__ == "__main__":
     print("EchoMind v0.16 | Launching GUI with cognition enabled...")
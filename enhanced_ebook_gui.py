@@ -5,7 +5,8 @@ def update_journal_tab(self):
         return
         
     try:
-        print(f"DEBUG JOURNAL: Updating journal for book ID: {self.current_book_id}")
+        if _DEBUG:
+            print(f"DEBUG JOURNAL: Updating journal for book ID: {self.current_book_id}")
         
         # Method 1: Try system's export method
         journal_content = None
@@ -18,9 +19,11 @@ def update_journal_tab(self):
                     journal_content = raw_journal
                 else:
                     journal_content = str(raw_journal)
-                print(f"DEBUG JOURNAL: Got journal: {len(journal_content)} chars")
+                if _DEBUG:
+                    print(f"DEBUG JOURNAL: Got journal: {len(journal_content)} chars")
             except Exception as e:
-                print(f"DEBUG JOURNAL: export_reading_journal failed: {e}")
+                if _DEBUG:
+                    print(f"DEBUG JOURNAL: export_reading_journal failed: {e}")
         
         # Method 2: Try to get book data and create journal
         if not journal_content:
@@ -40,17 +43,21 @@ def update_journal_tab(self):
                 
                 if book_data:
                     journal_content = self.create_detailed_journal_entry(book_data)
-                    print(f"DEBUG JOURNAL: Created detailed journal: {len(journal_content)} chars")
+                    if _DEBUG:
+                        print(f"DEBUG JOURNAL: Created detailed journal: {len(journal_content)} chars")
                 else:
-                    print("DEBUG JOURNAL: No book data found for detailed journal")
+                    if _DEBUG:
+                        print("DEBUG JOURNAL: No book data found for detailed journal")
                     
             except Exception as e:
-                print(f"DEBUG JOURNAL: Failed to create detailed journal: {e}")
+                if _DEBUG:
+                    print(f"DEBUG JOURNAL: Failed to create detailed journal: {e}")
         
         # Method 3: Create basic journal entry
         if not journal_content:
             journal_content = self.create_basic_journal_entry()
-            print("DEBUG JOURNAL: Created basic journal entry")
+            if _DEBUG:
+                print("DEBUG JOURNAL: Created basic journal entry")
         
         # Display the journal
         if journal_content:
@@ -67,7 +74,7 @@ def update_journal_tab(self):
     def create_detailed_journal_entry(self, book_data):
         """Create a detailed journal entry from book data"""
         try:
-            journal_text = f"📖 DETAILED READING LOG\n{'='*50}\n\n"
+            journal_text = f"📖 DETAILED READING LOG\n{_RULE50}\n\n"
             
             # Basic info
             metadata = book_data.get('metadata', {})
@@ -83,7 +90,7 @@ def update_journal_tab(self):
             # Analysis summary
             analysis = book_data.get('analysis', {})
             if analysis:
-                journal_text += f"ANALYSIS SUMMARY\n{'-'*30}\n"
+                journal_text += f"ANALYSIS SUMMARY\n{_SEP30}\n"
                 
                 # Characters
                 characters = analysis.get('characters', [])
@@ -152,7 +159,7 @@ def update_journal_tab(self):
                     journal_text += "\n"
             
             # Reading progress and dates
-            journal_text += f"READING RECORD\n{'-'*30}\n"
+            journal_text += f"READING RECORD\n{_SEP30}\n"
             journal_text += f"Analysis Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
             journal_text += f"Book ID: {self.current_book_id}\n"
             
@@ -164,7 +171,7 @@ def update_journal_tab(self):
                     journal_text += f"Added to Library: {metadata['ingestion_date']}\n"
             
             # Personal notes section
-            journal_text += f"\nPERSONAL NOTES\n{'-'*30}\n"
+            journal_text += f"\nPERSONAL NOTES\n{_SEP30}\n"
             
             # Try to load existing personal notes
             try:
@@ -172,8 +179,9 @@ def update_journal_tab(self):
                 if notes_file.exists():
                     with open(notes_file, 'r', encoding='utf-8') as f:
                         content = f.read()
-                        if "-" * 50 in content:
-                            notes_part = content.split("-" * 50, 1)[1].strip()
+                        idx = content.find(_SEP50)
+                        if idx >= 0:
+                            notes_part = content[idx + len(_SEP50):].strip()
                             journal_text += notes_part + "\n"
                         else:
                             journal_text += content + "\n"
@@ -182,7 +190,7 @@ def update_journal_tab(self):
             except Exception as e:
                 journal_text += f"Error loading personal notes: {e}\n"
             
-            journal_text += f"\n{'='*50}\n"
+            journal_text += f"\n{_RULE50}\n"
             journal_text += "End of Reading Log\n"
             
             return journal_text
@@ -195,18 +203,341 @@ Enhanced EBook GUI for EchoMind - Full Featured Version - FIXED
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QLabel, 
-    QPushButton, QFileDialog, QProgressBar, QListWidget, 
+    QPushButton, QFileDialog, QProgressBar,
     QTabWidget, QGroupBox, QGridLayout, QLineEdit, QComboBox,
     QScrollArea, QFrame, QCheckBox, QSpinBox, QTextBrowser,
-    QListWidgetItem, QMessageBox, QSplitter, QTreeWidget, QTreeWidgetItem
+    QMessageBox, QSplitter, QTreeWidget, QTreeWidgetItem,
+    QTreeView, QListView
+)
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QSignalBlocker,
+    QAbstractTableModel, QModelIndex
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QColor, QPalette, QTextCharFormat, QPixmap
+from PyQt5.QtGui import QFont, QColor, QPalette, QTextCharFormat, QPixmap, QTextCursor
 import json
 import datetime
+from collections import OrderedDict
+from itertools import groupby
+from operator import attrgetter, itemgetter
 from pathlib import Path
 import os
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Verbose tab-loading diagnostics, off unless ECHOMIND_DEBUG is set
+_DEBUG = bool(os.environ.get('ECHOMIND_DEBUG'))
+
+# Journal and notes section rules
+_SEP50 = "-" * 50
+_SEP30 = "-" * 30
+_RULE50 = "=" * 50
+
+# Placeholder shown in the discussion while a response is pending
+_THINKING_LINE = "🤖 EchoMind: *thinking...*"
+
+# Emotion timelines longer than this are grouped into expandable pages
+_TIMELINE_PAGINATE_OVER = 200
+_TIMELINE_PAGE = 50
+
+# Library auto-refresh interval
+_LIBRARY_REFRESH_MS = 30000  # Refresh every 30 seconds
+
+# Library rows handed to the view per scroll-driven fetch
+_LIBRARY_PAGE = 100
+
+# Books whose personal notes are kept in memory after viewing
+_NOTES_CACHE_SIZE = 32
+
+# Status label stylesheets, shared so Qt only re-parses on a state change
+_STYLE_INFO = "color: #87ceeb; font-size: 10pt;"
+_STYLE_OK = "color: #98fb98; font-size: 10pt;"
+_STYLE_WARN = "color: #ffa500; font-size: 10pt;"
+_STYLE_ERR = "color: #ff6b6b; font-size: 10pt;"
+
+# Field names that may hold character / theme lists in stored book data
+_CHAR_FIELDS = frozenset({'characters', 'chars', 'character_list', 'cast', 'dramatis_personae'})
+_THEME_FIELDS = frozenset({'themes', 'topics', 'theme_list', 'motifs'})
+
+def _to_int(x, default=0):
+    """Coerce a stored numeric field to int, taking the fast path for native numbers"""
+    if isinstance(x, int):
+        return x
+    if isinstance(x, float):
+        return int(x)
+    if not x:
+        return default
+    try:
+        return int(float(x))
+    except (TypeError, ValueError):
+        return default
+
+def _to_float(x, default=0.0):
+    """Coerce a stored numeric field to float, taking the fast path for native numbers"""
+    if isinstance(x, float):
+        return x
+    if isinstance(x, int):
+        return float(x)
+    if not x:
+        return default
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return default
+
+def _to_list(x):
+    """Coerce a stored sequence field to a list, reusing it when it already is one"""
+    if isinstance(x, list):
+        return x
+    return list(x) if x else []
+
+def _read_json(path):
+    """Read a JSON file, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_json(path, data):
+    """Write a JSON file with 2-space indent, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+
+def _getters(*keys):
+    """Precompiled (dict, object) accessors for a field's candidate keys"""
+    return tuple(map(itemgetter, keys)), tuple(map(attrgetter, keys))
+
+def _first_value(obj, getters, default):
+    """Return the first non-None value a getter finds, else default"""
+    for get in getters:
+        try:
+            v = get(obj)
+        except (KeyError, AttributeError):
+            continue
+        if v is not None:
+            return v
+    return default
+
+# Candidate keys for emotional arc points
+_EMOTION_GET = _getters('emotion', 'feeling', 'type')
+_INTENSITY_GET = _getters('intensity', 'strength', 'score')
+_CHAPTER_GET = _getters('chapter', 'location', 'position')
+_TRIGGER_GET = _getters('trigger', 'cause', 'context')
+
+# Stored quote fields
+_QUOTE_TEXT_GET = _getters('text')
+_QUOTE_CHAPTER_GET = _getters('chapter')
+_QUOTE_IMPACT_GET = _getters('emotional_impact')
+_QUOTE_SIGNIFICANCE_GET = _getters('significance_score')
+
+def _timeline_item(chapter, dominant):
+    """Emotion timeline row for a chapter's dominant emotion"""
+    return QTreeWidgetItem([
+        f"Chapter {chapter}",
+        dominant['emotion'].title(),
+        f"{dominant['intensity']:.2f}",
+        dominant['trigger'][:50],
+    ])
+
+def _extract_emotion_str(ep):
+    """Emotion is just a string"""
+    return ep, 0.5, 0, "Unknown"
+
+def _extract_emotion_dict(ep):
+    """Emotion is a dictionary"""
+    return (_first_value(ep, _EMOTION_GET[0], 'unknown'), _first_value(ep, _INTENSITY_GET[0], 0.0),
+            _first_value(ep, _CHAPTER_GET[0], 0), _first_value(ep, _TRIGGER_GET[0], 'unknown'))
+
+def _extract_emotion_obj(ep):
+    """Emotion is an object"""
+    return (_first_value(ep, _EMOTION_GET[1], 'unknown'), _first_value(ep, _INTENSITY_GET[1], 0.0),
+            _first_value(ep, _CHAPTER_GET[1], 0), _first_value(ep, _TRIGGER_GET[1], 'unknown'))
+
+def _extractor_for(ep):
+    """Pick the emotion point extractor for a point's type"""
+    if isinstance(ep, str):
+        return _extract_emotion_str
+    if isinstance(ep, dict):
+        return _extract_emotion_dict
+    return _extract_emotion_obj
+
+def _extract_emotion_mixed(ep):
+    """Slow path for arcs mixing point types"""
+    return _extractor_for(ep)(ep)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _dominant_per_chapter(chapters, intensities):
+        """Index of the most intense point per chapter, chapters ascending.
+        
+        A stable sort keeps the first point on ties, matching max().
+        """
+        order = np.argsort(chapters, kind='mergesort')
+        n = order.shape[0]
+        out_chapters = np.empty(n, np.int64)
+        out_best = np.empty(n, np.int64)
+        m = 0
+        i = 0
+        while i < n:
+            best = order[i]
+            chapter = chapters[best]
+            i += 1
+            while i < n and chapters[order[i]] == chapter:
+                j = order[i]
+                if intensities[j] > intensities[best]:
+                    best = j
+                i += 1
+            out_chapters[m] = chapter
+            out_best[m] = best
+            m += 1
+        return out_chapters[:m], out_best[:m]
+
+# Tree tab layouts. field_map maps each stored field to
+# (candidate keys, default, coercion); the first field is the entry's name.
+_CHARACTER_TAB = {
+    'label': 'characters',
+    'item_label': 'character',
+    'data_key': 'characters',
+    'alt_fields': _CHAR_FIELDS,
+    'field_map': {
+        'name': (('name', 'character', 'Character', 'char_name'), 'Unknown', str),
+        'mentions': (('mentions', 'count', 'frequency', 'occurrences'), 0, _to_int),
+        'significance_score': (('significance_score', 'importance', 'score', 'significance'), 0.0, _to_float),
+        'description': (('description', 'details', 'info', 'summary'), 'No description', str),
+    },
+    'string_defaults': {'mentions': 1, 'significance_score': 0.5, 'description': "Name only available"},
+    'columns': lambda d: [
+        d['name'],
+        str(d['mentions']),
+        f"{d['significance_score']:.2f}",
+        d['description'][:50] + ("..." if len(d['description']) > 50 else ""),
+    ],
+    'blank_columns': ("0", "0.0"),
+}
+
+_THEME_TAB = {
+    'label': 'themes',
+    'item_label': 'theme',
+    'data_key': 'themes',
+    'alt_fields': _THEME_FIELDS,
+    'field_map': {
+        'theme': (('theme', 'name', 'Theme', 'topic'), 'Unknown Theme', str),
+        'strength': (('strength', 'score', 'importance', 'weight'), 0.0, _to_float),
+        'chapters': (('chapters', 'locations', 'chapter_list', 'found_in'), (), _to_list),
+        'evidence': (('evidence', 'examples', 'quotes', 'supporting_text'), (), _to_list),
+    },
+    'string_defaults': {'strength': 0.5, 'chapters': (), 'evidence': ()},
+    'columns': lambda d: [
+        d['theme'],
+        "%.2f" % d['strength'],
+        "%d chapters" % len(d['chapters']),
+        "%d evidence" % len(d['evidence']),
+    ],
+    'blank_columns': ("0.0", "0 chapters"),
+}
+
+# Library reading-level colors and progress icons, built once
+_COLOR_HARD = QColor("#ff6b6b")  # Red for difficult
+_COLOR_EASY = QColor("#98fb98")  # Green for easy
+_COLOR_MID = QColor("#87ceeb")  # Blue for moderate
+_PROGRESS_ICONS = ("📚", "📖", "✅")  # Not started, reading, finished
+
+def _library_row(book):
+    """Format a library book record as its list label"""
+    # Safe access to book data
+    title = book.get('title', 'Unknown Title')
+    author = book.get('author', 'Unknown Author')
+    reading_progress = book.get('reading_progress', 0.0)
+    genre_hints = book.get('genre_hints', [])
+    
+    # Format display text
+    progress_indicator = _PROGRESS_ICONS[(reading_progress > 0) + (reading_progress > 0.9)]
+    display_text = f"{progress_indicator} {title}"
+    
+    if author != "Unknown Author":
+        display_text += f" - {author}"
+    
+    # Add genre hints if available
+    if genre_hints:
+        display_text += f" ({', '.join(genre_hints[:2])})"
+    
+    return [display_text]
+
+# Library colors by reading-level bucket: < 8, 8-15, > 15
+_LIBRARY_COLORS = (_COLOR_EASY, _COLOR_MID, _COLOR_HARD)
+
+def _library_colors(books):
+    """Foreground colors for a whole library at once, or None without numpy"""
+    if not NUMPY_AVAILABLE:
+        return None
+    levels = np.fromiter((book.get('reading_level', 0.0) for book in books), dtype=np.float64, count=len(books))
+    buckets = (levels >= 8).astype(np.intp) + (levels > 15)
+    return np.array(_LIBRARY_COLORS, dtype=object)[buckets]
+
+def _library_color(book):
+    """Color code a library book by reading level"""
+    reading_level = book.get('reading_level', 0.0)
+    if reading_level > 15:
+        return _COLOR_HARD
+    elif reading_level < 8:
+        return _COLOR_EASY
+    else:
+        return _COLOR_MID
+
+def _quote_row(quote):
+    """Format a quote record as its list label"""
+    text = quote['text']
+    if len(text) > 80:
+        text = text[:77] + "..."
+    return [f"Ch.{quote['chapter']}: \"{text}\""]
+
+# Reading insight rules as (predicate(metadata, analysis_summary), message) groups.
+# Rules within a group are mutually exclusive: only the first match fires.
+_INSIGHT_RULES = (
+    # Reading level insights
+    (
+        (lambda m, a: m['reading_level'] > 15, "🎓 This is a highly sophisticated work that will challenge you intellectually."),
+        (lambda m, a: m['reading_level'] < 8, "📖 This book offers accessible, straightforward reading."),
+        (lambda m, a: True, "📚 This book strikes a good balance between accessibility and depth."),
+    ),
+    # Length insights
+    (
+        (lambda m, a: m['word_count'] > 100000, "📏 This is a substantial work that will require significant time investment."),
+        (lambda m, a: m['word_count'] < 30000, "⚡ This is a concise work perfect for focused reading sessions."),
+    ),
+    # Character insights
+    (
+        (lambda m, a: a.get('characters_found', 0) > 10, "👥 Rich cast of characters - you'll need to keep track of many personalities."),
+        (lambda m, a: a.get('characters_found', 0) < 3, "👤 Character-focused narrative with intimate character development."),
+    ),
+    # Theme insights
+    (
+        (lambda m, a: a.get('themes_identified', 0) > 5, "🎭 Complex thematic structure with multiple layers of meaning."),
+        (lambda m, a: a.get('themes_identified', 0) > 0, "💭 Clear thematic focus that will provide food for thought."),
+    ),
+    # Quote insights
+    (
+        (lambda m, a: a.get('quotes_extracted', 0) > 20, "💎 Rich in memorable passages and quotable moments."),
+    ),
+)
+
 class AdvancedEbookWorker(QThread):
     """Background thread for advanced ebook processing"""
     
@@ -252,15 +583,149 @@ class BookDiscussionWorker(QThread):
         except Exception as e:
             self.response_ready.emit(f"Error processing question: {e}")
 
+class BookDataWorker(QThread):
+    """Background thread for loading stored book data"""
+
+    data_loaded = pyqtSignal(str, object)
+
+    def __init__(self, book_id, loader):
+        super().__init__()
+        self.book_id = book_id
+        self.loader = loader
+
+    def run(self):
+        try:
+            book_data = self.loader(self.book_id)
+        except Exception as e:
+            if _DEBUG:
+                print(f"DEBUG: _load_book_data failed: {e}")
+            book_data = None
+        self.data_loaded.emit(self.book_id, book_data)
+
+class NotesLoader(QThread):
+    """Background thread for reading a book's personal notes file"""
+
+    notes_loaded = pyqtSignal(str, str)
+
+    def __init__(self, book_id, notes_file):
+        super().__init__()
+        self.book_id = book_id
+        self.notes_file = notes_file
+
+    def run(self):
+        notes = ""
+        try:
+            if self.notes_file.exists():
+                content = self.notes_file.read_text(encoding='utf-8')
+                
+                # Extract just the notes part (after the header rule)
+                idx = content.find(_SEP50)
+                notes = content[idx + len(_SEP50):].strip() if idx >= 0 else content
+        except Exception as e:
+            print(f"Error loading personal notes: {e}")
+        self.notes_loaded.emit(self.book_id, notes)
+
+class RecordTableModel(QAbstractTableModel):
+    """Table model over plain Python records, formatted once when a row is first painted.
+    
+    With page_size set, rows are exposed to the view a page at a time as it
+    scrolls (fetchMore) instead of all at once.
+    """
+
+    def __init__(self, headers, format_row, foreground=None, page_size=None):
+        super().__init__()
+        self.headers = headers
+        self.format_row = format_row
+        self.foreground = foreground
+        self.page_size = page_size
+        self.rows = []
+        self.texts = []
+        self.colors = None
+        self.loaded = 0
+
+    def set_rows(self, rows, texts=None, colors=None):
+        """Replace all rows. Dict rows are records; list rows are preformatted messages.
+        
+        texts optionally gives the display columns for every row up front,
+        and colors the foreground of every record row in place of foreground().
+        """
+        self.beginResetModel()
+        self.rows = rows
+        self.texts = texts if texts is not None else [None] * len(rows)
+        self.colors = colors
+        self.loaded = len(rows) if self.page_size is None else min(len(rows), self.page_size)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.loaded < len(self.rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        end = min(len(self.rows), self.loaded + self.page_size)
+        if end > self.loaded:
+            self.beginInsertRows(QModelIndex(), self.loaded, end - 1)
+            self.loaded = end
+            self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            texts = self.texts[index.row()]
+            if texts is None:
+                texts = self.format_row(row) if isinstance(row, dict) else row
+                self.texts[index.row()] = texts
+            return texts[index.column()] if index.column() < len(texts) else ""
+        if role == Qt.UserRole and isinstance(row, dict):
+            return row
+        if role == Qt.ForegroundRole and isinstance(row, dict):
+            if self.colors is not None:
+                return self.colors[index.row()]
+            if self.foreground:
+                return self.foreground(row)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return None
+
 class EnhancedEbookTab(QWidget):
     """Enhanced ebook tab with comprehensive features"""
     
     def __init__(self, ebook_system=None):
         super().__init__()
         self.ebook_system = ebook_system
+        # System entry points, looked up once; None when the system lacks one
+        self._loader = getattr(ebook_system, '_load_book_data', None)
+        self._lib = getattr(ebook_system, 'get_book_library', None)
+        self._export_journal = getattr(ebook_system, 'export_reading_journal', None)
         self.current_book_id = None
         self.current_analysis = None
-        
+        # Last stored book data loaded from the system, as (book_id, data)
+        self._book_data = (None, None)
+        self.book_data_workers = set()
+        self.notes_workers = set()
+        # Personal notes of recently viewed books, most recent last
+        self._notes_cache = OrderedDict()
+        # Local quote annotations, read on first quote view per book
+        self._annotations_book = None
+        self._annotations_by_quote = {}
+        # Document position of the pending discussion thinking line
+        self._thinking_pos = None
+        # Analysis tabs still showing an older book; rebuilt when next shown
+        self._pending_result = None
+        self._pending_formatted = None
+        self._dirty = set()
+
         self.init_ui()
         self.setup_timers()
     
@@ -317,7 +782,8 @@ class EnhancedEbookTab(QWidget):
         
         # Format support status
         self.format_status = QLabel("Checking supported formats...")
-        self.format_status.setStyleSheet("color: #87ceeb; font-size: 10pt;")
+        self.format_status.setStyleSheet(_STYLE_INFO)
+        self._format_status_style = _STYLE_INFO
         load_layout.addWidget(self.format_status)
         
         # Load button
@@ -344,8 +810,14 @@ class EnhancedEbookTab(QWidget):
         library_layout = QVBoxLayout()
         
         # Library list
-        self.library_list = QListWidget()
-        self.library_list.itemClicked.connect(self.select_book_from_library)
+        self.library_list = QListView()
+        self.library_list.setModel(RecordTableModel(["Book"], _library_row, _library_color, page_size=_LIBRARY_PAGE))
+        self.library_list.setSelectionMode(QListView.ExtendedSelection)
+        # Fixed-height rows laid out in batches keep large libraries responsive
+        self.library_list.setUniformItemSizes(True)
+        self.library_list.setLayoutMode(QListView.Batched)
+        self.library_list.setBatchSize(100)
+        self.library_list.clicked.connect(self.select_book_from_library)
         self.library_list.setStyleSheet("background-color: #1e1e1e; color: #ffffff; border: 1px solid #444;")
         library_layout.addWidget(self.library_list)
         
@@ -440,6 +912,16 @@ class EnhancedEbookTab(QWidget):
         self.journal_tab = self.create_journal_tab()
         self.analysis_tabs.addTab(self.journal_tab, "📔 Journal")
         
+        self._tab_names = {
+            self.overview_tab: "overview",
+            self.characters_tab: "characters",
+            self.themes_tab: "themes",
+            self.emotions_tab: "emotions",
+            self.quotes_tab: "quotes",
+            self.journal_tab: "journal",
+        }
+        self.analysis_tabs.currentChanged.connect(self._refresh_current_tab)
+        
         layout.addWidget(self.analysis_tabs)
         panel.setLayout(layout)
         return panel
@@ -520,9 +1002,13 @@ class EnhancedEbookTab(QWidget):
         layout = QVBoxLayout()
         
         # Character list
-        self.character_tree = QTreeWidget()
-        self.character_tree.setHeaderLabels(["Character", "Mentions", "Significance", "Description"])
+        self.character_tree = QTreeView()
+        self.character_tree.setModel(RecordTableModel(
+            ["Character", "Mentions", "Significance", "Description"], _CHARACTER_TAB['columns']))
+        self.character_tree.setRootIsDecorated(False)
+        self.character_tree.setUniformRowHeights(True)
         self.character_tree.setStyleSheet("background-color: #1e1e1e; color: #ffffff; border: 1px solid #444;")
+        self.character_tree.clicked.connect(self.display_character_details)
         layout.addWidget(self.character_tree)
         
         # Character details
@@ -548,9 +1034,13 @@ class EnhancedEbookTab(QWidget):
         layout = QVBoxLayout()
         
         # Theme list
-        self.theme_tree = QTreeWidget()
-        self.theme_tree.setHeaderLabels(["Theme", "Strength", "Chapters", "Evidence"])
+        self.theme_tree = QTreeView()
+        self.theme_tree.setModel(RecordTableModel(
+            ["Theme", "Strength", "Chapters", "Evidence"], _THEME_TAB['columns']))
+        self.theme_tree.setRootIsDecorated(False)
+        self.theme_tree.setUniformRowHeights(True)
         self.theme_tree.setStyleSheet("background-color: #1e1e1e; color: #ffffff; border: 1px solid #444;")
+        self.theme_tree.clicked.connect(self.display_theme_details)
         layout.addWidget(self.theme_tree)
         
         # Theme details
@@ -595,6 +1085,10 @@ class EnhancedEbookTab(QWidget):
         self.emotion_timeline = QTreeWidget()
         self.emotion_timeline.setHeaderLabels(["Chapter", "Emotion", "Intensity", "Trigger"])
         self.emotion_timeline.setStyleSheet("background-color: #1e1e1e; color: #ffffff; border: 1px solid #444;")
+        self.emotion_timeline.setUniformRowHeights(True)
+        self.emotion_timeline.itemExpanded.connect(self.expand_timeline_page)
+        # Blank row cloned for placeholder and error messages
+        self._timeline_note_proto = QTreeWidgetItem(["", "", "", ""])
         
         timeline_layout.addWidget(self.emotion_timeline)
         timeline_group.setLayout(timeline_layout)
@@ -609,9 +1103,11 @@ class EnhancedEbookTab(QWidget):
         layout = QVBoxLayout()
         
         # Quote list
-        self.quotes_list = QListWidget()
+        self.quotes_list = QListView()
+        self.quotes_list.setModel(RecordTableModel(["Quote"], _quote_row))
+        self.quotes_list.setUniformItemSizes(True)
         self.quotes_list.setStyleSheet("background-color: #1e1e1e; color: #ffffff; border: 1px solid #444;")
-        self.quotes_list.itemClicked.connect(self.display_quote_details)
+        self.quotes_list.clicked.connect(self.display_quote_details)
         layout.addWidget(self.quotes_list)
         
         # Quote details
@@ -749,7 +1245,7 @@ class EnhancedEbookTab(QWidget):
         # Library refresh timer
         self.library_timer = QTimer()
         self.library_timer.timeout.connect(self.refresh_library)
-        self.library_timer.start(30000)  # Refresh every 30 seconds
+        self.library_timer.start(_LIBRARY_REFRESH_MS)
         
         # Initial setup
         self.refresh_library()
@@ -763,17 +1259,20 @@ class EnhancedEbookTab(QWidget):
                 supported = [fmt for fmt in status.get('supported_formats', []) if fmt]
                 
                 if supported:
-                    self.format_status.setText(f"Supported: {', '.join(supported)}")
-                    self.format_status.setStyleSheet("color: #98fb98; font-size: 10pt;")
+                    self.set_format_status(f"Supported: {', '.join(supported)}", _STYLE_OK)
                 else:
-                    self.format_status.setText("Only TXT files supported")
-                    self.format_status.setStyleSheet("color: #ffa500; font-size: 10pt;")
+                    self.set_format_status("Only TXT files supported", _STYLE_WARN)
             else:
-                self.format_status.setText("System status unavailable")
-                self.format_status.setStyleSheet("color: #ff6b6b; font-size: 10pt;")
+                self.set_format_status("System status unavailable", _STYLE_ERR)
         except Exception as e:
-            self.format_status.setText(f"Status error: {str(e)[:30]}")
-            self.format_status.setStyleSheet("color: #ff6b6b; font-size: 10pt;")
+            self.set_format_status(f"Status error: {str(e)[:30]}", _STYLE_ERR)
+    
+    def set_format_status(self, text, style):
+        """Update the format status label, restyling only when the state changes"""
+        self.format_status.setText(text)
+        if style is not self._format_status_style:
+            self.format_status.setStyleSheet(style)
+            self._format_status_style = style
     
     def load_book_file(self):
         """Load a new book file"""
@@ -823,23 +1322,20 @@ class EnhancedEbookTab(QWidget):
     
     def display_book_analysis(self, result):
         """Display the completed book analysis"""
+        # Keep the periodic library refresh from landing mid-populate
+        self.library_timer.stop()
         try:
             self.progress_bar.setVisible(False)
             self.load_button.setEnabled(True)
             self.status_label.setText("✅ Analysis complete!")
             
-            # Store current book data
+            # Store current book data; a fresh analysis replaces any loaded copy
             self.current_book_id = result.get('book_id')
+            self._book_data = (None, None)
             self.current_analysis = result.get('analysis_summary', {})
             
             # Update all displays
-            self.update_book_info(result)
-            self.update_overview_tab(result)
-            self.update_characters_tab(result)
-            self.update_themes_tab(result)
-            self.update_emotions_tab(result)
-            self.update_quotes_tab(result)
-            self.update_journal_tab()
+            self.show_book_result(result)
             
             # Refresh library
             self.refresh_library()
@@ -863,76 +1359,124 @@ class EnhancedEbookTab(QWidget):
             )
         except Exception as e:
             QMessageBox.critical(self, "Display Error", f"Error displaying analysis: {e}")
+        finally:
+            self.library_timer.start(_LIBRARY_REFRESH_MS)
     
     def handle_processing_error(self, error_message):
         """Handle processing errors"""
-        self.progress_bar.setVisible(False)
-        self.load_button.setEnabled(True)
-        self.status_label.setText("❌ Processing failed")
-        
-        QMessageBox.critical(self, "Processing Error", f"Failed to process book:\n{error_message}")
+        self.library_timer.stop()
+        try:
+            self.progress_bar.setVisible(False)
+            self.load_button.setEnabled(True)
+            self.status_label.setText("❌ Processing failed")
+            
+            QMessageBox.critical(self, "Processing Error", f"Failed to process book:\n{error_message}")
+        finally:
+            self.library_timer.start(_LIBRARY_REFRESH_MS)
     
-    def update_book_info(self, result):
-        """Update current book information display"""
+    def format_book_fields(self, result):
+        """Format the human-readable book fields shown in the info panel and overview tab"""
         try:
             metadata = result.get('metadata', {})
             analysis = result.get('analysis_summary', {})
             
             # Safe attribute access
-            title = getattr(metadata, 'title', 'Unknown Title') if hasattr(metadata, 'title') else metadata.get('title', 'Unknown Title')
-            author = getattr(metadata, 'author', 'Unknown Author') if hasattr(metadata, 'author') else metadata.get('author', 'Unknown Author')
-            word_count = getattr(metadata, 'word_count', 0) if hasattr(metadata, 'word_count') else metadata.get('word_count', 0)
-            reading_level = getattr(metadata, 'reading_level', 0.0) if hasattr(metadata, 'reading_level') else metadata.get('reading_level', 0.0)
-            reading_time = getattr(metadata, 'estimated_reading_time', 0) if hasattr(metadata, 'estimated_reading_time') else metadata.get('estimated_reading_time', 0)
-            chapter_count = getattr(metadata, 'chapter_count', 0) if hasattr(metadata, 'chapter_count') else metadata.get('chapter_count', 0)
+            def meta(key, default):
+                return getattr(metadata, key, default) if hasattr(metadata, key) else metadata.get(key, default)
+            
+            word_count = meta('word_count', 0)
+            reading_level = meta('reading_level', 0.0)
+            progress = meta('reading_progress', 0.0)
+            
+            return {
+                'title': f"{meta('title', 'Unknown Title')}",
+                'author': f"{meta('author', 'Unknown Author')}",
+                'word_count': f"{word_count:,}",
+                'reading_level': f"Grade {reading_level:.1f}",
+                'reading_time': f"{meta('estimated_reading_time', 0)}",
+                'chapters': str(meta('chapter_count', 0)),
+                'genres': ', '.join(analysis.get('genre_hints', [])),
+                'progress_percent': int(progress * 100),
+                'progress': f"{progress*100:.1f}% complete",
+            }
+        except Exception as e:
+            print(f"Error formatting book fields: {e}")
+            return None
+    
+    def show_book_result(self, result):
+        """Show a book's info panel now and mark every analysis tab for rebuild"""
+        self._pending_result = result
+        self._pending_formatted = self.format_book_fields(result)
+        self.update_book_info(result, self._pending_formatted)
+        self._dirty = set(self._tab_names.values())
+        self._refresh_current_tab()
+    
+    def _refresh_current_tab(self, index=None):
+        """Rebuild the visible analysis tab if it still shows an older book"""
+        name = self._tab_names.get(self.analysis_tabs.currentWidget())
+        if name not in self._dirty:
+            return
+        self._dirty.discard(name)
+        
+        result = self._pending_result
+        if name == "overview":
+            self.update_overview_tab(result, self._pending_formatted)
+        elif name == "characters":
+            self.update_characters_tab(result)
+        elif name == "themes":
+            self.update_themes_tab(result)
+        elif name == "emotions":
+            self.update_emotions_tab(result)
+        elif name == "quotes":
+            self.update_quotes_tab(result)
+        elif name == "journal":
+            self.update_journal_tab()
+    
+    def update_book_info(self, result, formatted=None):
+        """Update current book information display"""
+        try:
+            fields = formatted or self.format_book_fields(result)
             
-            self.book_title_label.setText(f"{title}")
+            self.book_title_label.setText(fields['title'])
             
-            info_text = f"Author: {author}\n"
-            info_text += f"Words: {word_count:,}\n"
-            info_text += f"Reading Level: Grade {reading_level:.1f}\n"
-            info_text += f"Estimated Time: {reading_time} minutes\n"
-            info_text += f"Chapters: {chapter_count}\n"
+            info_text = (
+                f"Author: {fields['author']}\n"
+                f"Words: {fields['word_count']}\n"
+                f"Reading Level: {fields['reading_level']}\n"
+                f"Estimated Time: {fields['reading_time']} minutes\n"
+                f"Chapters: {fields['chapters']}\n"
+            )
             
-            genre_hints = analysis.get('genre_hints', [])
-            if genre_hints:
-                info_text += f"Genre: {', '.join(genre_hints)}"
+            if fields['genres']:
+                info_text += f"Genre: {fields['genres']}"
             
             self.book_details.setPlainText(info_text)
             
             # Update reading progress
-            progress = getattr(metadata, 'reading_progress', 0.0) if hasattr(metadata, 'reading_progress') else metadata.get('reading_progress', 0.0)
-            self.reading_progress_bar.setValue(int(progress * 100))
-            self.reading_progress_label.setText(f"{progress*100:.1f}% complete")
+            self.reading_progress_bar.setValue(fields['progress_percent'])
+            self.reading_progress_label.setText(fields['progress'])
         except Exception as e:
             self.book_title_label.setText("Error loading book info")
             self.book_details.setPlainText(f"Error: {e}")
     
-    def update_overview_tab(self, result):
+    def update_overview_tab(self, result, formatted=None):
         """Update the overview tab with analysis results"""
         try:
-            metadata = result.get('metadata', {})
             analysis = result.get('analysis_summary', {})
-            
-            # Safe access to metadata
-            word_count = getattr(metadata, 'word_count', 0) if hasattr(metadata, 'word_count') else metadata.get('word_count', 0)
-            reading_level = getattr(metadata, 'reading_level', 0.0) if hasattr(metadata, 'reading_level') else metadata.get('reading_level', 0.0)
-            reading_time = getattr(metadata, 'estimated_reading_time', 0) if hasattr(metadata, 'estimated_reading_time') else metadata.get('estimated_reading_time', 0)
-            chapter_count = getattr(metadata, 'chapter_count', 0) if hasattr(metadata, 'chapter_count') else metadata.get('chapter_count', 0)
+            fields = formatted or self.format_book_fields(result)
             
             # Update statistics
-            self.stats_labels['word_count'].setText(f"{word_count:,}")
-            self.stats_labels['reading_level'].setText(f"Grade {reading_level:.1f}")
-            self.stats_labels['estimated_time'].setText(f"{reading_time} min")
-            self.stats_labels['chapters'].setText(str(chapter_count))
+            self.stats_labels['word_count'].setText(fields['word_count'])
+            self.stats_labels['reading_level'].setText(fields['reading_level'])
+            self.stats_labels['estimated_time'].setText(f"{fields['reading_time']} min")
+            self.stats_labels['chapters'].setText(fields['chapters'])
             self.stats_labels['characters_found'].setText(str(analysis.get('characters_found', 0)))
             self.stats_labels['themes_found'].setText(str(analysis.get('themes_identified', 0)))
             self.stats_labels['quotes_extracted'].setText(str(analysis.get('quotes_extracted', 0)))
             
             # Update genre
-            genre_hints = analysis.get('genre_hints', [])
-            if genre_hints:
-                self.genre_label.setText(f"Genre hints: {', '.join(genre_hints)}")
+            if fields['genres']:
+                self.genre_label.setText(f"Genre hints: {fields['genres']}")
             else:
                 self.genre_label.setText("Genre: Not determined")
             
@@ -953,44 +1497,15 @@ class EnhancedEbookTab(QWidget):
             metadata = result.get('metadata', {})
             analysis = result.get('analysis_summary', {})
             
-            insights = []
-            
             # Safe access to metadata
-            word_count = getattr(metadata, 'word_count', 0) if hasattr(metadata, 'word_count') else metadata.get('word_count', 0)
-            reading_level = getattr(metadata, 'reading_level', 0.0) if hasattr(metadata, 'reading_level') else metadata.get('reading_level', 0.0)
-            
-            # Reading level insights
-            if reading_level > 15:
-                insights.append("🎓 This is a highly sophisticated work that will challenge you intellectually.")
-            elif reading_level < 8:
-                insights.append("📖 This book offers accessible, straightforward reading.")
-            else:
-                insights.append("📚 This book strikes a good balance between accessibility and depth.")
-            
-            # Length insights
-            if word_count > 100000:
-                insights.append("📏 This is a substantial work that will require significant time investment.")
-            elif word_count < 30000:
-                insights.append("⚡ This is a concise work perfect for focused reading sessions.")
+            md = {
+                'word_count': getattr(metadata, 'word_count', 0) if hasattr(metadata, 'word_count') else metadata.get('word_count', 0),
+                'reading_level': getattr(metadata, 'reading_level', 0.0) if hasattr(metadata, 'reading_level') else metadata.get('reading_level', 0.0),
+            }
             
-            # Character insights
-            chars_found = analysis.get('characters_found', 0)
-            if chars_found > 10:
-                insights.append("👥 Rich cast of characters - you'll need to keep track of many personalities.")
-            elif chars_found < 3:
-                insights.append("👤 Character-focused narrative with intimate character development.")
-            
-            # Theme insights
-            themes_found = analysis.get('themes_identified', 0)
-            if themes_found > 5:
-                insights.append("🎭 Complex thematic structure with multiple layers of meaning.")
-            elif themes_found > 0:
-                insights.append("💭 Clear thematic focus that will provide food for thought.")
-            
-            # Quote insights
-            quotes_found = analysis.get('quotes_extracted', 0)
-            if quotes_found > 20:
-                insights.append("💎 Rich in memorable passages and quotable moments.")
+            # First matching rule of each group wins
+            insights = [next((msg for pred, msg in group if pred(md, analysis)), None) for group in _INSIGHT_RULES]
+            insights = [msg for msg in insights if msg]
             
             return "\n\n".join(insights)
         except Exception as e:
@@ -998,181 +1513,175 @@ class EnhancedEbookTab(QWidget):
     
     def update_characters_tab(self, result):
         """FIXED - Update characters analysis tab with better debugging"""
+        self._update_tree_tab(result, tree=self.character_tree, spec=_CHARACTER_TAB)
+
+    def _cached_book_data(self):
+        """The current book's stored data if it was already loaded, else None"""
+        book_id, book_data = self._book_data
+        return book_data if book_id == self.current_book_id else None
+
+    def _remember_book_data(self, book_id, book_data):
+        if book_data:
+            self._book_data = (book_id, book_data)
+
+    def _load_current_book_data(self):
+        """The current book's stored data, loaded on the GUI thread only on a cache miss"""
+        book_data = self._cached_book_data()
+        if book_data is None:
+            book_data = self._loader(self.current_book_id)
+            self._remember_book_data(self.current_book_id, book_data)
+        return book_data
+
+    def _update_tree_tab(self, result, *, tree, spec):
+        """Shared update path for the characters and themes trees"""
         if not self.ebook_system or not self.current_book_id:
             return
-        
+
+        # Method 1: Load the system's stored book data off the GUI thread,
+        # unless another tab already loaded it for this book
+        if self._loader:
+            book_data = self._cached_book_data()
+            if book_data is not None:
+                self._populate_tree_tab(self.current_book_id, book_data, result, tree=tree, spec=spec)
+                return
+
+            tree.model().set_rows([[f"Loading {spec['label']}..."]])
+
+            worker = BookDataWorker(self.current_book_id, self._loader)
+            worker.data_loaded.connect(self._remember_book_data)
+            worker.data_loaded.connect(
+                lambda book_id, book_data: self._populate_tree_tab(
+                    book_id, book_data, result, tree=tree, spec=spec)
+            )
+            worker.finished.connect(lambda: self.book_data_workers.discard(worker))
+            self.book_data_workers.add(worker)
+            worker.start()
+        else:
+            self._populate_tree_tab(self.current_book_id, None, result, tree=tree, spec=spec)
+
+    def _populate_tree_tab(self, book_id, book_data, result, *, tree, spec):
+        """Fill a characters/themes tree once book data is available"""
+        if book_id != self.current_book_id:
+            return  # A different book was selected while loading
+
+        model = tree.model()
+        label = spec['label']
+        tag = label.upper()
+        blank = spec['blank_columns']
+
         try:
-            # Try multiple ways to get book data
-            book_data = None
-            
-            # Method 1: Try system's load method
-            if hasattr(self.ebook_system, '_load_book_data'):
-                try:
-                    book_data = self.ebook_system._load_book_data(self.current_book_id)
-                    print(f"DEBUG: Loaded book data via _load_book_data: {type(book_data)}")
-                except Exception as e:
-                    print(f"DEBUG: _load_book_data failed: {e}")
-                    book_data = None
-            
+            if _DEBUG:
+                print(f"DEBUG {tag}: Loaded book data via _load_book_data: {type(book_data)}")
+
             # Method 2: Use result data directly
             if not book_data and result:
                 book_data = {'analysis': result.get('analysis', {})}
-                print(f"DEBUG: Using result data: {type(book_data)}")
+                if _DEBUG:
+                    print(f"DEBUG {tag}: Using result data: {type(book_data)}")
             
             # Method 3: Try to get from system's library
-            if not book_data and hasattr(self.ebook_system, 'get_book_library'):
+            if not book_data and self._lib:
                 try:
-                    books = self.ebook_system.get_book_library()
+                    books = self._lib()
                     for book in books:
                         if book.get('id') == self.current_book_id:
                             book_data = book
                             break
-                    print(f"DEBUG: Found book in library: {book_data is not None}")
+                    if _DEBUG:
+                        print(f"DEBUG {tag}: Found book in library: {book_data is not None}")
                 except Exception as e:
-                    print(f"DEBUG: Library search failed: {e}")
+                    if _DEBUG:
+                        print(f"DEBUG {tag}: Library search failed: {e}")
             
             if not book_data:
-                self.character_tree.clear()
-                error_item = QTreeWidgetItem()
-                error_item.setText(0, "No book data available")
-                error_item.setText(1, "0")
-                error_item.setText(2, "0.0")
-                error_item.setText(3, "Check console for debug info")
-                self.character_tree.addTopLevelItem(error_item)
-                print(f"DEBUG: No book data found for ID: {self.current_book_id}")
+                model.set_rows([["No book data available", *blank, "Check console for debug info"]])
+                if _DEBUG:
+                    print(f"DEBUG {tag}: No book data found for ID: {self.current_book_id}")
                 return
             
-            # Extract characters from various possible locations
-            characters = []
+            # Extract entries from various possible locations
+            data_key = spec['data_key']
+            entries = []
             
             # Try different data structures
             if 'analysis' in book_data:
-                analysis = book_data['analysis']
-                characters = analysis.get('characters', [])
-                print(f"DEBUG: Found {len(characters)} characters in analysis")
-            
-            if not characters and 'characters' in book_data:
-                characters = book_data['characters']
-                print(f"DEBUG: Found {len(characters)} characters in root")
-            
-            if not characters:
-                # Try to find any field that might contain character data
-                for key, value in book_data.items():
-                    if isinstance(value, list) and key.lower().find('char') != -1:
-                        characters = value
-                        print(f"DEBUG: Found characters in field '{key}': {len(characters)} items")
-                        break
-            
-            print(f"DEBUG: Final characters list: {len(characters)} items")
-            if characters:
-                print(f"DEBUG: First character sample: {characters[0]}")
-            
-            self.character_tree.clear()
-            
-            if not characters:
-                no_chars_item = QTreeWidgetItem()
-                no_chars_item.setText(0, "No characters found")
-                no_chars_item.setText(1, "0")
-                no_chars_item.setText(2, "0.0")
-                no_chars_item.setText(3, "Analysis may be incomplete or using different format")
-                self.character_tree.addTopLevelItem(no_chars_item)
+                entries = book_data['analysis'].get(data_key, [])
+                if _DEBUG:
+                    print(f"DEBUG {tag}: Found {len(entries)} {label} in analysis")
+            
+            if not entries and data_key in book_data:
+                entries = book_data[data_key]
+                if _DEBUG:
+                    print(f"DEBUG {tag}: Found {len(entries)} {label} in root")
+            
+            if not entries:
+                # Try any other known field name for this data
+                alt_fields = spec['alt_fields']
+                entries = next((book_data[k] for k in book_data
+                                if k.lower() in alt_fields and isinstance(book_data[k], list)), [])
+                if _DEBUG:
+                    print(f"DEBUG {tag}: Found {label} in alternate field: {len(entries)} items")
+            
+            if _DEBUG:
+                print(f"DEBUG {tag}: Final {label} list: {len(entries)} items")
+            if entries:
+                if _DEBUG:
+                    print(f"DEBUG {tag}: First {spec['item_label']} sample: {entries[0]}")
+            
+            if not entries:
+                model.set_rows([[f"No {label} found", *blank, "Analysis may be incomplete or using different format"]])
                 return
             
-            for i, char in enumerate(characters):
-                item = QTreeWidgetItem()
-                
+            field_map = spec['field_map']
+            name_field = next(iter(field_map))
+            string_defaults = spec['string_defaults']
+            rows = []
+            
+            for i, entry in enumerate(entries):
                 try:
-                    print(f"DEBUG: Processing character {i}: {type(char)} - {char}")
+                    if _DEBUG:
+                        print(f"DEBUG {tag}: Processing {spec['item_label']} {i}: {type(entry)} - {entry}")
                     
-                    # Handle different character data formats
-                    if isinstance(char, str):
-                        # Character is just a string (name only)
-                        char_name = char
-                        char_mentions = 1
-                        char_significance = 0.5
-                        char_description = "Name only available"
-                    elif isinstance(char, dict):
-                        # Character is a dictionary - try multiple key combinations
-                        char_name = (char.get('name') or 
-                                   char.get('character') or 
-                                   char.get('Character') or 
-                                   char.get('char_name') or 
-                                   'Unknown')
-                        
-                        char_mentions = (char.get('mentions') or 
-                                       char.get('count') or 
-                                       char.get('frequency') or 
-                                       char.get('occurrences') or 0)
-                        
-                        char_significance = (char.get('significance_score') or 
-                                           char.get('importance') or 
-                                           char.get('score') or 
-                                           char.get('significance') or 0.0)
-                        
-                        char_description = (char.get('description') or 
-                                          char.get('details') or 
-                                          char.get('info') or 
-                                          char.get('summary') or 
-                                          'No description')
-                    else:
-                        # Character is an object
-                        char_name = self.safe_get_attr(char, 'name', 'Unknown')
-                        char_mentions = self.safe_get_attr(char, 'mentions', 0)
-                        char_significance = self.safe_get_attr(char, 'significance_score', 0.0)
-                        char_description = self.safe_get_attr(char, 'description', 'No description')
-                    
-                    # Ensure data types are correct
-                    char_name = str(char_name) if char_name is not None else "Unknown"
-                    char_mentions = int(float(str(char_mentions))) if char_mentions not in [None, ''] else 0
-                    char_significance = float(str(char_significance)) if char_significance not in [None, ''] else 0.0
-                    char_description = str(char_description) if char_description is not None else "No description"
-                    
-                    item.setText(0, char_name)
-                    item.setText(1, str(char_mentions))
-                    item.setText(2, f"{char_significance:.2f}")
-                    item.setText(3, char_description[:50] + ("..." if len(char_description) > 50 else ""))
-                    
-                    # Store data for details view
-                    char_dict = {
-                        'name': char_name,
-                        'mentions': char_mentions,
-                        'significance_score': char_significance,
-                        'description': char_description
-                    }
-                    item.setData(0, Qt.UserRole, char_dict)
-                    
-                    self.character_tree.addTopLevelItem(item)
-                    print(f"DEBUG: Successfully added character: {char_name}")
+                    # Stored as-is for the details view; the model formats it on paint
+                    values = self._tree_entry_fields(entry, field_map, string_defaults)
+                    rows.append(values)
+                    if _DEBUG:
+                        print(f"DEBUG {tag}: Successfully added {spec['item_label']}: {values[name_field]}")
                     
                 except Exception as e:
-                    print(f"ERROR: Failed to process character {i}: {e}")
-                    # Add error item for this character
-                    error_item = QTreeWidgetItem()
-                    error_item.setText(0, f"Error: {str(char)[:20]}...")
-                    error_item.setText(1, "0")
-                    error_item.setText(2, "0.0")
-                    error_item.setText(3, f"Parse error: {str(e)[:20]}")
-                    self.character_tree.addTopLevelItem(error_item)
+                    print(f"ERROR {tag}: Failed to process {spec['item_label']} {i}: {e}")
+                    # Add error row for this entry
+                    rows.append([f"Error: {str(entry)[:20]}...", *blank, f"Parse error: {str(e)[:20]}"])
                     continue
             
-            # Connect selection handler
-            self.character_tree.itemClicked.connect(self.display_character_details)
-            print(f"DEBUG: Characters tab updated successfully with {self.character_tree.topLevelItemCount()} items")
+            # Swap in all rows with a single model reset
+            model.set_rows(rows)
+            
+            if _DEBUG:
+                print(f"DEBUG {tag}: Tab updated successfully with {model.rowCount()} items")
             
         except Exception as e:
-            print(f"ERROR: Major error updating characters tab: {e}")
-            self.character_tree.clear()
-            error_item = QTreeWidgetItem()
-            error_item.setText(0, "Critical Error")
-            error_item.setText(1, "0")
-            error_item.setText(2, "0.0")
-            error_item.setText(3, f"Error: {str(e)[:30]}")
-            self.character_tree.addTopLevelItem(error_item)
-
-    def display_character_details(self, item):
+            print(f"ERROR {tag}: Major error updating {label} tab: {e}")
+            model.set_rows([["Critical Error", *blank, f"Error: {str(e)[:30]}"]])
+
+    def _tree_entry_fields(self, entry, field_map, string_defaults):
+        """Normalize a character/theme entry given as a string, dict or object"""
+        if isinstance(entry, str):
+            # Entry is just a name
+            raw = dict(string_defaults, **{next(iter(field_map)): entry})
+        else:
+            # Dict or object - take the first non-empty candidate key
+            get = entry.get if isinstance(entry, dict) else (lambda key: self.safe_get_attr(entry, key))
+            raw = {field: next((v for v in map(get, keys) if v), default)
+                   for field, (keys, default, _) in field_map.items()}
+        
+        # Ensure data types are correct
+        return {field: coerce(raw[field]) for field, (_, _, coerce) in field_map.items()}
+
+    def display_character_details(self, index):
         """Display detailed character information"""
         try:
-            char_data = item.data(0, Qt.UserRole)
+            char_data = index.data(Qt.UserRole)
             if char_data:
                 details = f"**{char_data['name']}**\n\n"
                 details += f"Mentions: {char_data['mentions']}\n"
@@ -1187,180 +1696,12 @@ class EnhancedEbookTab(QWidget):
     
     def update_themes_tab(self, result):
         """FIXED - Update themes analysis tab with better debugging"""
-        if not self.ebook_system or not self.current_book_id:
-            return
-            
-        try:
-            # Try multiple ways to get book data
-            book_data = None
-            
-            # Method 1: Try system's load method
-            if hasattr(self.ebook_system, '_load_book_data'):
-                try:
-                    book_data = self.ebook_system._load_book_data(self.current_book_id)
-                    print(f"DEBUG THEMES: Loaded book data via _load_book_data: {type(book_data)}")
-                except Exception as e:
-                    print(f"DEBUG THEMES: _load_book_data failed: {e}")
-                    book_data = None
-            
-            # Method 2: Use result data directly
-            if not book_data and result:
-                book_data = {'analysis': result.get('analysis', {})}
-                print(f"DEBUG THEMES: Using result data: {type(book_data)}")
-            
-            # Method 3: Try to get from system's library
-            if not book_data and hasattr(self.ebook_system, 'get_book_library'):
-                try:
-                    books = self.ebook_system.get_book_library()
-                    for book in books:
-                        if book.get('id') == self.current_book_id:
-                            book_data = book
-                            break
-                    print(f"DEBUG THEMES: Found book in library: {book_data is not None}")
-                except Exception as e:
-                    print(f"DEBUG THEMES: Library search failed: {e}")
-            
-            if not book_data:
-                self.theme_tree.clear()
-                error_item = QTreeWidgetItem()
-                error_item.setText(0, "No book data available")
-                error_item.setText(1, "0.0")
-                error_item.setText(2, "0 chapters")
-                error_item.setText(3, "Check console for debug info")
-                self.theme_tree.addTopLevelItem(error_item)
-                print(f"DEBUG THEMES: No book data found for ID: {self.current_book_id}")
-                return
-            
-            # Extract themes from various possible locations
-            themes = []
-            
-            # Try different data structures
-            if 'analysis' in book_data:
-                analysis = book_data['analysis']
-                themes = analysis.get('themes', [])
-                print(f"DEBUG THEMES: Found {len(themes)} themes in analysis")
-            
-            if not themes and 'themes' in book_data:
-                themes = book_data['themes']
-                print(f"DEBUG THEMES: Found {len(themes)} themes in root")
-            
-            if not themes:
-                # Try to find any field that might contain theme data
-                for key, value in book_data.items():
-                    if isinstance(value, list) and key.lower().find('theme') != -1:
-                        themes = value
-                        print(f"DEBUG THEMES: Found themes in field '{key}': {len(themes)} items")
-                        break
-            
-            print(f"DEBUG THEMES: Final themes list: {len(themes)} items")
-            if themes:
-                print(f"DEBUG THEMES: First theme sample: {themes[0]}")
-            
-            self.theme_tree.clear()
-            
-            if not themes:
-                no_themes_item = QTreeWidgetItem()
-                no_themes_item.setText(0, "No themes found")
-                no_themes_item.setText(1, "0.0")
-                no_themes_item.setText(2, "0 chapters")
-                no_themes_item.setText(3, "Analysis may be incomplete or using different format")
-                self.theme_tree.addTopLevelItem(no_themes_item)
-                return
-            
-            for i, theme in enumerate(themes):
-                item = QTreeWidgetItem()
-                
-                try:
-                    print(f"DEBUG THEMES: Processing theme {i}: {type(theme)} - {theme}")
-                    
-                    # Handle different theme data formats
-                    if isinstance(theme, str):
-                        # Theme is just a string
-                        theme_name = theme
-                        theme_strength = 0.5
-                        theme_chapters = []
-                        theme_evidence = []
-                    elif isinstance(theme, dict):
-                        # Theme is a dictionary - try multiple key combinations
-                        theme_name = (theme.get('theme') or 
-                                    theme.get('name') or 
-                                    theme.get('Theme') or 
-                                    theme.get('topic') or 
-                                    'Unknown Theme')
-                        
-                        theme_strength = (theme.get('strength') or 
-                                        theme.get('score') or 
-                                        theme.get('importance') or 
-                                        theme.get('weight') or 0.0)
-                        
-                        theme_chapters = (theme.get('chapters') or 
-                                        theme.get('locations') or 
-                                        theme.get('chapter_list') or 
-                                        theme.get('found_in') or [])
-                        
-                        theme_evidence = (theme.get('evidence') or 
-                                        theme.get('examples') or 
-                                        theme.get('quotes') or 
-                                        theme.get('supporting_text') or [])
-                    else:
-                        # Theme is an object
-                        theme_name = self.safe_get_attr(theme, 'theme', self.safe_get_attr(theme, 'name', 'Unknown Theme'))
-                        theme_strength = self.safe_get_attr(theme, 'strength', self.safe_get_attr(theme, 'score', 0.0))
-                        theme_chapters = self.safe_get_attr(theme, 'chapters', self.safe_get_attr(theme, 'locations', []))
-                        theme_evidence = self.safe_get_attr(theme, 'evidence', self.safe_get_attr(theme, 'examples', []))
-                    
-                    # Ensure data types are correct
-                    theme_name = str(theme_name) if theme_name is not None else "Unknown Theme"
-                    theme_strength = float(str(theme_strength)) if theme_strength not in [None, ''] else 0.0
-                    theme_chapters = list(theme_chapters) if theme_chapters is not None else []
-                    theme_evidence = list(theme_evidence) if theme_evidence is not None else []
-                    
-                    item.setText(0, theme_name)
-                    item.setText(1, f"{theme_strength:.2f}")
-                    item.setText(2, f"{len(theme_chapters)} chapters")
-                    item.setText(3, f"{len(theme_evidence)} evidence")
-                    
-                    # Store data for details view
-                    theme_dict = {
-                        'theme': theme_name,
-                        'strength': theme_strength,
-                        'chapters': theme_chapters,
-                        'evidence': theme_evidence
-                    }
-                    item.setData(0, Qt.UserRole, theme_dict)
-                    
-                    self.theme_tree.addTopLevelItem(item)
-                    print(f"DEBUG THEMES: Successfully added theme: {theme_name}")
-                    
-                except Exception as e:
-                    print(f"ERROR THEMES: Failed to process theme {i}: {e}")
-                    # Add error item for this theme
-                    error_item = QTreeWidgetItem()
-                    error_item.setText(0, f"Error: {str(theme)[:20]}...")
-                    error_item.setText(1, "0.0")
-                    error_item.setText(2, "0 chapters")
-                    error_item.setText(3, f"Parse error: {str(e)[:20]}")
-                    self.theme_tree.addTopLevelItem(error_item)
-                    continue
-            
-            # Connect selection handler
-            self.theme_tree.itemClicked.connect(self.display_theme_details)
-            print(f"DEBUG THEMES: Themes tab updated successfully with {self.theme_tree.topLevelItemCount()} items")
-            
-        except Exception as e:
-            print(f"ERROR THEMES: Major error updating themes tab: {e}")
-            self.theme_tree.clear()
-            error_item = QTreeWidgetItem()
-            error_item.setText(0, "Critical Error")
-            error_item.setText(1, "0.0")
-            error_item.setText(2, "0 chapters")
-            error_item.setText(3, f"Error: {str(e)[:30]}")
-            self.theme_tree.addTopLevelItem(error_item)
-
-    def display_theme_details(self, item):
+        self._update_tree_tab(result, tree=self.theme_tree, spec=_THEME_TAB)
+
+    def display_theme_details(self, index):
         """Display detailed theme information"""
         try:
-            theme_data = item.data(0, Qt.UserRole)
+            theme_data = index.data(Qt.UserRole)
             if theme_data:
                 details = f"**{theme_data['theme']}**\n\n"
                 details += f"Strength: {theme_data['strength']:.2f}\n"
@@ -1381,8 +1722,8 @@ class EnhancedEbookTab(QWidget):
             
         try:
             # Try to get book data safely
-            if hasattr(self.ebook_system, '_load_book_data'):
-                book_data = self.ebook_system._load_book_data(self.current_book_id)
+            if self._loader:
+                book_data = self._load_current_book_data()
             else:
                 # Fallback to result data
                 book_data = {'analysis': result.get('analysis', {})}
@@ -1399,42 +1740,34 @@ class EnhancedEbookTab(QWidget):
                 self.emotion_timeline.clear()
                 return
             
-            # Process emotions safely
-            emotions_by_type = {}
+            # Process emotions safely; emotion names are interned to codes
+            # in first-seen order so the summary can reduce them in one pass
+            emotion_codes = {}
+            codes = []
+            intensities = []
             timeline_data = []
             
+            # Arcs come from one analyzer and are normally homogeneous, so
+            # pick the extractor for the data format once up front
+            first_type = type(emotional_arc[0])
+            if all(type(ep) is first_type for ep in emotional_arc):
+                extract = _extractor_for(emotional_arc[0])
+            else:
+                extract = _extract_emotion_mixed
+            
             for ep in emotional_arc:
                 try:
-                    # Handle different emotion data formats
-                    if isinstance(ep, str):
-                        # Emotion is just a string
-                        emotion = ep
-                        intensity = 0.5  # Default intensity
-                        chapter = 0
-                        trigger = "Unknown"
-                    elif isinstance(ep, dict):
-                        # Emotion is a dictionary
-                        emotion = ep.get('emotion', ep.get('feeling', ep.get('type', 'unknown')))
-                        intensity = ep.get('intensity', ep.get('strength', ep.get('score', 0.0)))
-                        chapter = ep.get('chapter', ep.get('location', ep.get('position', 0)))
-                        trigger = ep.get('trigger', ep.get('cause', ep.get('context', 'unknown')))
-                    else:
-                        # Emotion is an object
-                        emotion = self.safe_get_attr(ep, 'emotion', self.safe_get_attr(ep, 'feeling', 'unknown'))
-                        intensity = self.safe_get_attr(ep, 'intensity', self.safe_get_attr(ep, 'strength', 0.0))
-                        chapter = self.safe_get_attr(ep, 'chapter', self.safe_get_attr(ep, 'location', 0))
-                        trigger = self.safe_get_attr(ep, 'trigger', self.safe_get_attr(ep, 'cause', 'unknown'))
+                    emotion, intensity, chapter, trigger = extract(ep)
                     
                     # Ensure data types are correct
                     emotion = str(emotion) if emotion is not None else 'unknown'
-                    intensity = float(intensity) if intensity is not None else 0.0
-                    chapter = int(chapter) if chapter is not None else 0
+                    intensity = _to_float(intensity)
+                    chapter = _to_int(chapter)
                     trigger = str(trigger) if trigger is not None else 'unknown'
                     
                     # Collect for summary
-                    if emotion not in emotions_by_type:
-                        emotions_by_type[emotion] = []
-                    emotions_by_type[emotion].append(intensity)
+                    codes.append(emotion_codes.setdefault(emotion, len(emotion_codes)))
+                    intensities.append(intensity)
                     
                     # Collect for timeline
                     timeline_data.append({
@@ -1450,137 +1783,190 @@ class EnhancedEbookTab(QWidget):
             
             # Create summary
             summary_parts = []
-            for emotion, intensities in emotions_by_type.items():
-                if intensities:
-                    avg_intensity = sum(intensities) / len(intensities)
-                    summary_parts.append(f"{emotion.title()}: {avg_intensity:.2f} avg ({len(intensities)} times)")
+            if codes:
+                sums, counts = self._sum_by_code(codes, intensities, len(emotion_codes))
+                for emotion, total, count in zip(emotion_codes, sums, counts):
+                    summary_parts.append(f"{emotion.title()}: {total / count:.2f} avg ({count} times)")
             
             self.emotion_summary.setPlainText("\n".join(summary_parts) if summary_parts else "No emotional data")
             
             # Create timeline
-            self.emotion_timeline.clear()
-            
             if not timeline_data:
-                no_emotions_item = QTreeWidgetItem()
-                no_emotions_item.setText(0, "No emotional timeline available")
-                self.emotion_timeline.addTopLevelItem(no_emotions_item)
+                self.set_timeline_note("No emotional timeline available")
                 return
             
-            # Group by chapter
-            by_chapter = {}
-            for item in timeline_data:
-                chapter = item['chapter']
-                if chapter not in by_chapter:
-                    by_chapter[chapter] = []
-                by_chapter[chapter].append(item)
-            
-            for chapter in sorted(by_chapter.keys()):
-                chapter_item = QTreeWidgetItem()
-                chapter_item.setText(0, f"Chapter {chapter}")
-                
-                chapter_emotions = by_chapter[chapter]
-                if chapter_emotions:
-                    dominant = max(chapter_emotions, key=lambda x: x['intensity'])
-                    chapter_item.setText(1, dominant['emotion'].title())
-                    chapter_item.setText(2, f"{dominant['intensity']:.2f}")
-                    chapter_item.setText(3, dominant['trigger'][:50])
-                
-                self.emotion_timeline.addTopLevelItem(chapter_item)
+            # Pick the dominant emotion per chapter
+            if NUMBA_AVAILABLE:
+                n = len(timeline_data)
+                chapters_arr = np.fromiter((item['chapter'] for item in timeline_data), dtype=np.int64, count=n)
+                intensities_arr = np.fromiter(intensities, dtype=np.float64, count=n)
+                best_chapters, best_idx = _dominant_per_chapter(chapters_arr, intensities_arr)
+                dominant_by_chapter = [(chapter, timeline_data[i])
+                                       for chapter, i in zip(best_chapters.tolist(), best_idx.tolist())]
+            else:
+                # Group by chapter in one scan; the sort is stable, so max()
+                # still keeps the earliest point on ties
+                timeline_data.sort(key=itemgetter('chapter'))
+                dominant_by_chapter = [(chapter, max(points, key=itemgetter('intensity')))
+                                       for chapter, points in groupby(timeline_data, key=itemgetter('chapter'))]
+            
+            if len(dominant_by_chapter) > _TIMELINE_PAGINATE_OVER:
+                # Long books: one collapsed node per page, rows built on expand
+                chapter_items = []
+                for start in range(0, len(dominant_by_chapter), _TIMELINE_PAGE):
+                    page = dominant_by_chapter[start:start + _TIMELINE_PAGE]
+                    page_item = QTreeWidgetItem([f"Chapters {page[0][0]}-{page[-1][0]}", "", "", ""])
+                    page_item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+                    page_item.setData(0, Qt.UserRole, page)
+                    chapter_items.append(page_item)
+            else:
+                chapter_items = [_timeline_item(chapter, dominant) for chapter, dominant in dominant_by_chapter]
+            
+            # Swap in all rows at once without per-row signals or repaints
+            with QSignalBlocker(self.emotion_timeline):
+                self.emotion_timeline.setUpdatesEnabled(False)
+                try:
+                    self.emotion_timeline.clear()
+                    self.emotion_timeline.addTopLevelItems(chapter_items)
+                finally:
+                    self.emotion_timeline.setUpdatesEnabled(True)
             
         except Exception as e:
             print(f"Error updating emotions tab: {e}")
             self.emotion_summary.setPlainText(f"Error loading emotional analysis: {str(e)}")
-            self.emotion_timeline.clear()
+            self.set_timeline_note(f"Error: {str(e)[:50]}")
+
+    def expand_timeline_page(self, item):
+        """Build a timeline page's chapter rows the first time it is expanded"""
+        page = item.data(0, Qt.UserRole)
+        if page and not item.childCount():
+            item.addChildren([_timeline_item(chapter, dominant) for chapter, dominant in page])
+            item.setData(0, Qt.UserRole, None)
+
+    def set_timeline_note(self, text):
+        """Replace the emotion timeline with a single message row"""
+        note = self._timeline_note_proto.clone()
+        note.setText(0, text)
+        self.emotion_timeline.clear()
+        self.emotion_timeline.addTopLevelItem(note)
+
+    def _sum_by_code(self, codes, values, n_codes):
+        """Per-code sums and counts of values, vectorized when NumPy is available"""
+        if NUMPY_AVAILABLE:
+            codes_arr = np.fromiter(codes, dtype=np.intp, count=len(codes))
+            values_arr = np.fromiter(values, dtype=np.float64, count=len(values))
+            sums = np.bincount(codes_arr, weights=values_arr, minlength=n_codes)
+            counts = np.bincount(codes_arr, minlength=n_codes)
+            return sums.tolist(), counts.tolist()
+        
+        sums = [0.0] * n_codes
+        counts = [0] * n_codes
+        for code, value in zip(codes, values):
+            sums[code] += value
+            counts[code] += 1
+        return sums, counts
 
     def update_quotes_tab(self, result):
         """FIXED - Update quotes collection tab"""
         if not self.ebook_system or not self.current_book_id:
             return
-            
+        
+        model = self.quotes_list.model()
+        
         try:
             # Try to get book data safely
-            if hasattr(self.ebook_system, '_load_book_data'):
-                book_data = self.ebook_system._load_book_data(self.current_book_id)
+            if self._loader:
+                book_data = self._load_current_book_data()
             else:
                 # Fallback to result data
                 book_data = {'analysis': result.get('analysis', {})}
             
             if not book_data:
-                self.quotes_list.clear()
-                error_item = QListWidgetItem()
-                error_item.setText("No book data available")
-                self.quotes_list.addItem(error_item)
+                model.set_rows([["No book data available"]])
                 return
             
             quotes = book_data.get('analysis', {}).get('quotes', [])
-            self.quotes_list.clear()
             
             if not quotes:
-                no_quotes_item = QListWidgetItem()
-                no_quotes_item.setText("No quotes found - analysis may be incomplete")
-                self.quotes_list.addItem(no_quotes_item)
+                model.set_rows([["No quotes found - analysis may be incomplete"]])
                 return
             
+            rows = []
+            append = rows.append
             for quote in quotes:
                 try:
-                    quote_text = self.safe_get_attr(quote, 'text', 'No text')
-                    quote_chapter = self.safe_get_attr(quote, 'chapter', 0)
-                    
-                    display_text = str(quote_text)
-                    if len(display_text) > 80:
-                        display_text = display_text[:77] + "..."
+                    if isinstance(quote, str):
+                        # Quote is just its text
+                        append({'text': quote, 'chapter': 0,
+                                'emotional_impact': 'unknown', 'significance_score': 0.0})
+                        continue
                     
-                    item = QListWidgetItem()
-                    item.setText(f"Ch.{quote_chapter}: \"{display_text}\"")
+                    kind = 0 if isinstance(quote, dict) else 1
                     
-                    # Store quote data
-                    quote_dict = {
-                        'text': str(quote_text),
-                        'chapter': int(quote_chapter),
-                        'emotional_impact': self.safe_get_attr(quote, 'emotional_impact', 'unknown'),
-                        'significance_score': self.safe_get_attr(quote, 'significance_score', 0.0)
-                    }
-                    item.setData(Qt.UserRole, quote_dict)
-                    
-                    self.quotes_list.addItem(item)
+                    # Store quote data; the model formats the label on paint
+                    append({
+                        'text': str(_first_value(quote, _QUOTE_TEXT_GET[kind], 'No text')),
+                        'chapter': _to_int(_first_value(quote, _QUOTE_CHAPTER_GET[kind], 0)),
+                        'emotional_impact': _first_value(quote, _QUOTE_IMPACT_GET[kind], 'unknown'),
+                        'significance_score': _first_value(quote, _QUOTE_SIGNIFICANCE_GET[kind], 0.0)
+                    })
                     
                 except Exception as e:
                     print(f"Error processing quote: {e}")
                     continue
+            
+            # Format every label in one pass; quotes are few and all visible
+            model.set_rows(rows, [_quote_row(quote) for quote in rows])
                     
         except Exception as e:
             print(f"Error updating quotes tab: {e}")
-            self.quotes_list.clear()
-            error_item = QListWidgetItem()
-            error_item.setText(f"Error loading quotes: {str(e)[:50]}")
-            self.quotes_list.addItem(error_item)
+            model.set_rows([[f"Error loading quotes: {str(e)[:50]}"]])
 
-    def display_quote_details(self, item):
+    def display_quote_details(self, index):
         """Display detailed quote information"""
         try:
-            quote_data = item.data(Qt.UserRole)
+            quote_data = index.data(Qt.UserRole)
             if quote_data:
                 details = f"Chapter {quote_data['chapter']}\n"
                 details += f"Emotional Impact: {quote_data.get('emotional_impact', 'Not analyzed')}\n"
                 details += f"Significance: {quote_data.get('significance_score', 0):.2f}\n\n"
                 details += f"\"{quote_data['text']}\"\n"
                 
+                for note in self.quote_annotations(quote_data):
+                    details += f"\nYour Note: {note.get('annotation', '')}"
+                
                 self.quote_details.setPlainText(details)
         except Exception as e:
             self.quote_details.setPlainText(f"Error displaying quote details: {e}")
     
+    def quote_annotations(self, quote_data):
+        """Locally saved annotations for a quote, loading the book's file on first use"""
+        if self._annotations_book != self.current_book_id:
+            self._annotations_book = self.current_book_id
+            self._annotations_by_quote = {}
+            annotation_file = Path("logs/annotations") / f"{self.current_book_id}_annotations.json"
+            try:
+                if annotation_file.exists():
+                    for note in _read_json(annotation_file):
+                        key = (note.get('chapter'), note.get('quote'))
+                        self._annotations_by_quote.setdefault(key, []).append(note)
+            except Exception as e:
+                print(f"Error loading annotations: {e}")
+        
+        return self._annotations_by_quote.get((quote_data['chapter'], quote_data['text']), [])
+    
     def add_quote_annotation(self):
         """Add annotation to selected quote"""
         try:
-            current_item = self.quotes_list.currentItem()
-            if not current_item or not self.current_book_id:
+            current_index = self.quotes_list.currentIndex()
+            if not current_index.isValid() or not self.current_book_id:
                 return
                 
             annotation_text = self.annotation_input.text().strip()
             if not annotation_text:
                 return
                 
-            quote_data = current_item.data(Qt.UserRole)
+            quote_data = current_index.data(Qt.UserRole)
             if quote_data and self.ebook_system:
                 # Add annotation to the system if method exists
                 if hasattr(self.ebook_system, 'add_annotation'):
@@ -1615,11 +2001,7 @@ class EnhancedEbookTab(QWidget):
             annotation_file = annotations_dir / f"{self.current_book_id}_annotations.json"
             
             # Load existing annotations
-            if annotation_file.exists():
-                with open(annotation_file, 'r', encoding='utf-8') as f:
-                    annotations = json.load(f)
-            else:
-                annotations = []
+            annotations = _read_json(annotation_file) if annotation_file.exists() else []
             
             # Add new annotation
             new_annotation = {
@@ -1631,8 +2013,12 @@ class EnhancedEbookTab(QWidget):
             annotations.append(new_annotation)
             
             # Save annotations
-            with open(annotation_file, 'w', encoding='utf-8') as f:
-                json.dump(annotations, f, indent=2, ensure_ascii=False)
+            _write_json(annotation_file, annotations)
+            
+            # Keep the loaded annotation index in step with the file
+            if self._annotations_book == self.current_book_id:
+                key = (new_annotation['chapter'], new_annotation['quote'])
+                self._annotations_by_quote.setdefault(key, []).append(new_annotation)
             
             return True
         except Exception as e:
@@ -1653,8 +2039,9 @@ class EnhancedEbookTab(QWidget):
         self.discussion_history.append(f"\n🤔 You: {question}\n")
         self.question_input.clear()
         
-        # Show thinking indicator
-        self.discussion_history.append("🤖 EchoMind: *thinking...*\n")
+        # Show thinking indicator; append starts a new paragraph at the current end
+        self._thinking_pos = self.discussion_history.document().characterCount()
+        self.discussion_history.append(_THINKING_LINE + "\n")
         
         # Start discussion worker if method exists
         if hasattr(self.ebook_system, 'ask_about_book'):
@@ -1673,14 +2060,11 @@ class EnhancedEbookTab(QWidget):
         """Display EchoMind's response to the question"""
         try:
             # Remove thinking indicator
-            current_text = self.discussion_history.toPlainText()
-            if "*thinking...*" in current_text:
-                current_text = current_text.replace("🤖 EchoMind: *thinking...*\n", "")
-                self.discussion_history.setPlainText(current_text)
+            self.remove_thinking_line()
             
             # Add response
             self.discussion_history.append(f"🤖 EchoMind: {response}\n")
-            self.discussion_history.append("-" * 50 + "\n")
+            self.discussion_history.append(_SEP50 + "\n")
             
             # Scroll to bottom
             cursor = self.discussion_history.textCursor()
@@ -1689,6 +2073,29 @@ class EnhancedEbookTab(QWidget):
         except Exception as e:
             self.discussion_history.append(f"🤖 EchoMind: Error displaying response: {e}\n")
     
+    def remove_thinking_line(self):
+        """Delete the pending thinking paragraph in place, without re-setting the whole text"""
+        pos = self._thinking_pos
+        self._thinking_pos = None
+        if pos is None:
+            return
+        
+        document = self.discussion_history.document()
+        if pos >= document.characterCount():
+            return
+        
+        cursor = QTextCursor(document)
+        cursor.setPosition(pos)
+        cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+        if cursor.selectedText() != _THINKING_LINE:
+            return  # The discussion changed underneath us
+        
+        # Take the preceding paragraph break with it
+        end = cursor.position()
+        cursor.setPosition(pos - 1)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        cursor.removeSelectedText()
+    
     def load_preset_question(self, question):
         """Load a preset question"""
         if question and question != "":
@@ -1701,30 +2108,33 @@ class EnhancedEbookTab(QWidget):
             return
 
         try:
-            print(f"DEBUG JOURNAL: Updating journal for book ID: {self.current_book_id}")
+            if _DEBUG:
+                print(f"DEBUG JOURNAL: Updating journal for book ID: {self.current_book_id}")
             journal_content = None
 
             # Try method 1
-            if hasattr(self.ebook_system, 'export_reading_journal'):
+            if self._export_journal:
                 try:
-                    journal_content = self.ebook_system.export_reading_journal(self.current_book_id)
+                    journal_content = self._export_journal(self.current_book_id)
                     if isinstance(journal_content, dict):
                         journal_content = json.dumps(journal_content, indent=2, ensure_ascii=False)
                     elif not isinstance(journal_content, str):
                         journal_content = str(journal_content)
-                    print(f"DEBUG JOURNAL: Got journal: {len(journal_content)} chars")
+                    if _DEBUG:
+                        print(f"DEBUG JOURNAL: Got journal: {len(journal_content)} chars")
                 except Exception as e:
-                    print(f"DEBUG JOURNAL: export_reading_journal failed: {e}")
+                    if _DEBUG:
+                        print(f"DEBUG JOURNAL: export_reading_journal failed: {e}")
 
             # Method 2
             if not journal_content:
                 try:
                     book_data = None
-                    if hasattr(self.ebook_system, '_load_book_data'):
-                        book_data = self.ebook_system._load_book_data(self.current_book_id)
+                    if self._loader:
+                        book_data = self._load_current_book_data()
 
-                    if not book_data and hasattr(self.ebook_system, 'get_book_library'):
-                        books = self.ebook_system.get_book_library()
+                    if not book_data and self._lib:
+                        books = self._lib()
                         for book in books:
                             if book.get('id') == self.current_book_id:
                                 book_data = book
@@ -1732,16 +2142,20 @@ class EnhancedEbookTab(QWidget):
 
                     if book_data:
                         journal_content = self.create_detailed_journal_entry(book_data)
-                        print(f"DEBUG JOURNAL: Created detailed journal: {len(journal_content)} chars")
+                        if _DEBUG:
+                            print(f"DEBUG JOURNAL: Created detailed journal: {len(journal_content)} chars")
                     else:
-                        print("DEBUG JOURNAL: No book data found for detailed journal")
+                        if _DEBUG:
+                            print("DEBUG JOURNAL: No book data found for detailed journal")
                 except Exception as e:
-                    print(f"DEBUG JOURNAL: Failed to create detailed journal: {e}")
+                    if _DEBUG:
+                        print(f"DEBUG JOURNAL: Failed to create detailed journal: {e}")
 
             # Method 3
             if not journal_content:
                 journal_content = self.create_basic_journal_entry()
-                print("DEBUG JOURNAL: Created basic journal entry")
+                if _DEBUG:
+                    print("DEBUG JOURNAL: Created basic journal entry")
 
             self.journal_display.setPlainText(journal_content or "Unable to generate journal entry")
 
@@ -1757,7 +2171,7 @@ class EnhancedEbookTab(QWidget):
                 return "No book selected for journal entry."
                 
             # Create a simple journal entry
-            journal_text = f"📖 BASIC READING LOG\n{'='*50}\n\n"
+            journal_text = f"📖 BASIC READING LOG\n{_RULE50}\n\n"
             journal_text += f"Book ID: {self.current_book_id}\n"
             journal_text += f"Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
             
@@ -1774,20 +2188,21 @@ class EnhancedEbookTab(QWidget):
             
             # Add analysis summary if available
             if hasattr(self, 'current_analysis') and self.current_analysis:
-                journal_text += f"ANALYSIS SUMMARY\n{'-'*30}\n"
+                journal_text += f"ANALYSIS SUMMARY\n{_SEP30}\n"
                 journal_text += f"Characters Found: {self.current_analysis.get('characters_found', 0)}\n"
                 journal_text += f"Themes Identified: {self.current_analysis.get('themes_identified', 0)}\n"
                 journal_text += f"Quotes Extracted: {self.current_analysis.get('quotes_extracted', 0)}\n\n"
             
             # Try to include personal notes
-            journal_text += f"PERSONAL NOTES\n{'-'*30}\n"
+            journal_text += f"PERSONAL NOTES\n{_SEP30}\n"
             try:
                 notes_file = Path("logs/book_notes") / f"{self.current_book_id}_notes.txt"
                 if notes_file.exists():
                     with open(notes_file, 'r', encoding='utf-8') as f:
                         content = f.read()
-                        if "-" * 50 in content:
-                            notes_part = content.split("-" * 50, 1)[1].strip()
+                        idx = content.find(_SEP50)
+                        if idx >= 0:
+                            notes_part = content[idx + len(_SEP50):].strip()
                             journal_text += notes_part + "\n"
                         else:
                             journal_text += content + "\n"
@@ -1796,9 +2211,9 @@ class EnhancedEbookTab(QWidget):
             except Exception as e:
                 journal_text += f"Error loading personal notes: {e}\n"
             
-            journal_text += f"\n{'-'*50}\n"
+            journal_text += f"\n{_SEP50}\n"
             journal_text += "Note: This is a basic journal entry. Full journaling features may not be available with the current ebook system.\n"
-            journal_text += f"{'='*50}\n"
+            journal_text += f"{_RULE50}\n"
             
             return journal_text
         except Exception as e:
@@ -1812,8 +2227,8 @@ class EnhancedEbookTab(QWidget):
             
         try:
             # Try to get journal from system
-            if hasattr(self.ebook_system, 'export_reading_journal'):
-                journal = self.ebook_system.export_reading_journal()
+            if self._export_journal:
+                journal = self._export_journal()
             else:
                 # Fallback to current display
                 journal = self.journal_display.toPlainText()
@@ -1845,8 +2260,8 @@ class EnhancedEbookTab(QWidget):
             
         try:
             # Get complete journal with better error handling
-            if hasattr(self.ebook_system, 'get_book_library'):
-                books = self.ebook_system.get_book_library()
+            if self._lib:
+                books = self._lib()
                 if books:
                     simple_journal = "📚 MY READING HISTORY\n\n"
                     for book in books[:10]:  # Last 10 books
@@ -1919,11 +2334,15 @@ class EnhancedEbookTab(QWidget):
             
             notes_file = notes_dir / f"{self.current_book_id}_notes.txt"
             
-            with open(notes_file, 'w', encoding='utf-8') as f:
-                f.write(f"Personal Notes for Book ID: {self.current_book_id}\n")
-                f.write(f"Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("-" * 50 + "\n")
-                f.write(notes)
+            notes_file.write_text(
+                f"Personal Notes for Book ID: {self.current_book_id}\n"
+                f"Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"{_SEP50}\n"
+                f"{notes}",
+                encoding='utf-8'
+            )
+            
+            self._cache_personal_notes(self.current_book_id, notes)
             
             QMessageBox.information(self, "Notes Saved", "Your personal notes have been saved!")
             
@@ -1934,70 +2353,34 @@ class EnhancedEbookTab(QWidget):
         """Refresh the book library display"""
         if not self.ebook_system:
             return
+        
+        model = self.library_list.model()
             
         try:
-            if hasattr(self.ebook_system, 'get_book_library'):
-                books = self.ebook_system.get_book_library()
-                
-                self.library_list.clear()
+            if self._lib:
+                books = self._lib()
                 
                 if not books:
-                    no_books_item = QListWidgetItem()
-                    no_books_item.setText("📚 No books in library - load a book to get started!")
-                    self.library_list.addItem(no_books_item)
+                    model.set_rows([["📚 No books in library - load a book to get started!"]])
                     return
                 
-                for book in books:
-                    item = QListWidgetItem()
-                    
-                    # Safe access to book data
-                    title = book.get('title', 'Unknown Title')
-                    author = book.get('author', 'Unknown Author')
-                    reading_progress = book.get('reading_progress', 0.0)
-                    genre_hints = book.get('genre_hints', [])
-                    reading_level = book.get('reading_level', 0.0)
-                    
-                    # Format display text
-                    progress_indicator = "✅" if reading_progress > 0.9 else "📖" if reading_progress > 0 else "📚"
-                    display_text = f"{progress_indicator} {title}"
-                    
-                    if author != "Unknown Author":
-                        display_text += f" - {author}"
-                    
-                    # Add genre hints if available
-                    if genre_hints:
-                        display_text += f" ({', '.join(genre_hints[:2])})"
-                    
-                    item.setText(display_text)
-                    item.setData(Qt.UserRole, book)
-                    
-                    # Color coding based on reading level
-                    if reading_level > 15:
-                        item.setForeground(QColor("#ff6b6b"))  # Red for difficult
-                    elif reading_level < 8:
-                        item.setForeground(QColor("#98fb98"))  # Green for easy
-                    else:
-                        item.setForeground(QColor("#87ceeb"))  # Blue for moderate
-                    
-                    self.library_list.addItem(item)
+                # Swap in all books with a single model reset; rows are
+                # formatted by the model as they are painted, and colored
+                # from one vectorized pass over reading levels
+                books = list(books)
+                model.set_rows(books, colors=_library_colors(books))
             else:
                 # System doesn't have library functionality
-                self.library_list.clear()
-                no_lib_item = QListWidgetItem()
-                no_lib_item.setText("📚 Library feature not available with current system")
-                self.library_list.addItem(no_lib_item)
+                model.set_rows([["📚 Library feature not available with current system"]])
                 
         except Exception as e:
             print(f"Error refreshing library: {e}")
-            self.library_list.clear()
-            error_item = QListWidgetItem()
-            error_item.setText(f"📚 Error loading library: {str(e)[:50]}")
-            self.library_list.addItem(error_item)
+            model.set_rows([[f"📚 Error loading library: {str(e)[:50]}"]])
     
-    def select_book_from_library(self, item):
+    def select_book_from_library(self, index):
         """Select a book from the library"""
         try:
-            book_data = item.data(Qt.UserRole)
+            book_data = index.data(Qt.UserRole)
             if book_data and self.ebook_system:
                 book_id = book_data.get('id')
                 if not book_id:
@@ -2007,8 +2390,10 @@ class EnhancedEbookTab(QWidget):
                 self.current_book_id = book_id
                 
                 # Load full book data
-                if hasattr(self.ebook_system, '_load_book_data'):
-                    full_book_data = self.ebook_system._load_book_data(self.current_book_id)
+                if self._loader:
+                    # Read fresh on selection; the tabs then reuse this copy
+                    full_book_data = self._loader(self.current_book_id)
+                    self._remember_book_data(self.current_book_id, full_book_data)
                     if full_book_data:
                         # Create a result-like structure for consistency
                         result = {
@@ -2027,13 +2412,7 @@ class EnhancedEbookTab(QWidget):
                         }
                         
                         # Update all displays
-                        self.update_book_info(result)
-                        self.update_overview_tab(result)
-                        self.update_characters_tab(result)
-                        self.update_themes_tab(result)
-                        self.update_emotions_tab(result)
-                        self.update_quotes_tab(result)
-                        self.update_journal_tab()
+                        self.show_book_result(result)
                         
                         # Load personal notes if they exist
                         self.load_personal_notes()
@@ -2052,30 +2431,37 @@ class EnhancedEbookTab(QWidget):
         """Load personal notes for the current book"""
         if not self.current_book_id:
             return
-            
-        try:
-            notes_file = Path("logs/book_notes") / f"{self.current_book_id}_notes.txt"
-            
-            if notes_file.exists():
-                with open(notes_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                    # Extract just the notes part (after the header)
-                    if "-" * 50 in content:
-                        notes_part = content.split("-" * 50, 1)[1].strip()
-                        self.personal_notes.setPlainText(notes_part)
-                    else:
-                        self.personal_notes.setPlainText(content)
-            else:
-                self.personal_notes.clear()
-                
-        except Exception as e:
-            print(f"Error loading personal notes: {e}")
-            self.personal_notes.clear()
+        
+        book_id = self.current_book_id
+        notes = self._notes_cache.get(book_id)
+        if notes is not None:
+            self._notes_cache.move_to_end(book_id)
+            self.personal_notes.setPlainText(notes)
+            return
+        
+        # Read the file off the GUI thread
+        self.personal_notes.clear()
+        worker = NotesLoader(book_id, Path("logs/book_notes") / f"{book_id}_notes.txt")
+        worker.notes_loaded.connect(self._show_personal_notes)
+        worker.finished.connect(lambda: self.notes_workers.discard(worker))
+        self.notes_workers.add(worker)
+        worker.start()
+    
+    def _cache_personal_notes(self, book_id, notes):
+        self._notes_cache[book_id] = notes
+        self._notes_cache.move_to_end(book_id)
+        if len(self._notes_cache) > _NOTES_CACHE_SIZE:
+            self._notes_cache.popitem(last=False)
+    
+    def _show_personal_notes(self, book_id, notes):
+        """Show notes read by a NotesLoader unless the book or the editor changed meanwhile"""
+        self._cache_personal_notes(book_id, notes)
+        if book_id == self.current_book_id and not self.personal_notes.toPlainText():
+            self.personal_notes.setPlainText(notes)
     
     def compare_selected_books(self):
         """Compare two selected books"""
-        selected_items = self.library_list.selectedItems()
+        selected_items = self.library_list.selectionModel().selectedIndexes()
         
         if len(selected_items) != 2:
             QMessageBox.information(
@@ -1,5 +1,5 @@
 from collections import Counter
-import datetime
+import time
 
 class ExperienceEngine:
     def __init__(self):
@@ -12,7 +12,7 @@ class ExperienceEngine:
         Log experience and outcome type: success, failure, joy, friction, etc.
         """
         self.feedback_log.append({
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": time.time_ns(),  # epoch ns; format when displayed
             "context": context[-3:],  # last 3 exchanges
             "response": response,
             "outcome": outcome
@@ -23,10 +23,10 @@ class ExperienceEngine:
         """
         Apply simple feedback trends to personality traits.
         """
-        if self.outcome_counts["failure"] > self.outcome_counts["success"]:
-            trait_engine.trait_counts["cautious"] += 1
-        elif self.outcome_counts["success"] > self.outcome_counts["failure"]:
-            trait_engine.trait_counts["resilient"] += 1
+        counts = self.outcome_counts
+        delta = counts["success"] - counts["failure"]
+        if delta:
+            trait_engine.trait_counts["resilient" if delta > 0 else "cautious"] += 1
 
     def get_summary(self):
         return dict(self.outcome_counts)
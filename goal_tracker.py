@@ -1,9 +1,15 @@
 import datetime
+import time
+
+
+def _fmt(ns):
+    return datetime.datetime.fromtimestamp(ns / 1e9).isoformat()
+
 
 class GoalEntry:
     def __init__(self, description, motivation=None):
         self.description = description
-        self.created_at = datetime.datetime.now()
+        self.created_at = time.time_ns()
         self.updated_at = self.created_at
         self.motivation = motivation or "unspecified"
         self.abandoned = False
@@ -12,15 +18,15 @@ class GoalEntry:
     def to_dict(self):
         return {
             "description": self.description,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": _fmt(self.created_at),
+            "updated_at": _fmt(self.updated_at),
             "motivation": self.motivation,
             "abandoned": self.abandoned,
             "fulfilled": self.fulfilled,
         }
 
     def update(self, new_desc=None, fulfilled=None, abandoned=None, motivation=None):
-        self.updated_at = datetime.datetime.now()
+        self.updated_at = time.time_ns()
         if new_desc:
             self.description = new_desc
         if motivation:
@@ -39,6 +45,11 @@ class GoalTracker:
         goal = GoalEntry(description, motivation)
         self.goal_log.append(goal)
 
+    def add_goals_batch(self, goals):
+        """Add several (description, motivation) goals in one call"""
+        entries = [GoalEntry(description, motivation) for description, motivation in goals]
+        self.goal_log.extend(entries)
+
     def update_latest_goal(self, **kwargs):
         if self.goal_log:
             self.goal_log[-1].update(**kwargs)
@@ -1,20 +1,54 @@
-from transformers import AutoModelForCausalLM, AutoTokenizer
+import transformers
+from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
+from packaging import version
 import torch
 
+try:
+    import bitsandbytes  # noqa: F401
+    BNB_AVAILABLE = True
+except ImportError:
+    BNB_AVAILABLE = False
+
 MODEL_NAME = "mistralai/Mistral-7B-Instruct-v0.1"
 
-# Load once at import
+# Load once at import. Decoding is bound by reading the weights each token, so
+# NF4 weights (~4 GB instead of ~14 GB in fp16) generate several times faster.
 tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
-model = AutoModelForCausalLM.from_pretrained(
-    MODEL_NAME,
-    torch_dtype=torch.float16,
-    device_map="auto"
-)
+if BNB_AVAILABLE and torch.cuda.is_available():
+    model = AutoModelForCausalLM.from_pretrained(
+        MODEL_NAME,
+        quantization_config=BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_quant_type="nf4",
+            bnb_4bit_compute_dtype=torch.float16,
+            bnb_4bit_use_double_quant=True,
+        ),
+        device_map="auto"
+    )
+else:
+    model = AutoModelForCausalLM.from_pretrained(
+        MODEL_NAME,
+        torch_dtype=torch.float16,
+        device_map="auto"
+    )
+
+# Compile the decode step once so CUDA graphs replay it; a static KV cache keeps
+# tensor shapes fixed between steps so the graphs are not recaptured per token.
+# bitsandbytes kernels don't trace under torch.compile, so only the fp16 model is compiled.
+# Older transformers ignore cache_implementation="static", and the compiled forward would
+# then recompile for every new sequence length, so compile only where it's honoured.
+STATIC_CACHE_AVAILABLE = version.parse(transformers.__version__).release >= (4, 38)
+if (STATIC_CACHE_AVAILABLE and torch.cuda.is_available() and hasattr(torch, "compile")
+        and not getattr(model, "is_loaded_in_4bit", False)):
+    model.generation_config.cache_implementation = "static"
+    model.forward = torch.compile(model.forward, mode="reduce-overhead", fullgraph=False)
 
 def run_gpu_llm(prompt, max_tokens=256):
     try:
-        inputs = tokenizer(prompt, return_tensors="pt").to(model.device)
-        output = model.generate(**inputs, max_new_tokens=max_tokens)
+        with torch.inference_mode():
+            inputs = tokenizer(prompt, return_tensors="pt").to(model.device)
+            output = model.generate(**inputs, max_new_tokens=max_tokens, use_cache=True,
+                                    pad_token_id=tokenizer.eos_token_id)
         return tokenizer.decode(output[0], skip_special_tokens=True)
     except Exception as e:
         return f"[GPU LLM error: {e}]"
@@ -0,0 +1,25 @@
+import os
+
+# Lock model weights in RAM (no page-fault stalls mid-generation) only on hosts
+# with room to spare; llm_interface's and enrichment_llm's models each lock ~4 GB
+MLOCK_MIN_RAM_MB = 16384
+
+def total_ram_mb():
+    """Physical memory in MB, or None if it can't be read"""
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        pass
+    try:
+        import psutil
+        return psutil.virtual_memory().total // (1024 * 1024)
+    except Exception:
+        return None
+
+def use_mlock():
+    """ECHOMIND_MLOCK=1/0 if set, else lock when the host has enough RAM"""
+    mlock_env = os.environ.get("ECHOMIND_MLOCK")
+    if mlock_env is not None:
+        return mlock_env == "1"
+    total_mb = total_ram_mb()
+    return total_mb is not None and total_mb >= MLOCK_MIN_RAM_MB
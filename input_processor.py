@@ -1,34 +1,78 @@
 from datetime import datetime
+from enum import IntEnum
 import os
 
+class Modality(IntEnum):
+    TEXT = 0
+    AUDIO = 1
+    IMAGE = 2
+    SENSOR = 3
+    TEXT_CORPUS = 4
+
+def _as_modality(modality):
+    """Accept a Modality or its name ("text", "text_corpus", ...); other values are kept as given."""
+    if isinstance(modality, Modality):
+        return modality
+    try:
+        return Modality[modality.upper()]
+    except (KeyError, AttributeError):
+        return modality
+
 class InputSignal:
     def __init__(self, source, modality, data, timestamp=None):
         self.source = source              # e.g., "user", "microphone", "camera", "file"
-        self.modality = modality          # e.g., "text", "audio", "image", "sensor", "text_corpus"
+        self.modality = _as_modality(modality)  # Modality.TEXT, AUDIO, IMAGE, SENSOR, TEXT_CORPUS (other names kept as-is)
         self.data = data                  # Raw input data or filepath
         self.timestamp = timestamp or datetime.now()
 
 class InputRouter:
     def __init__(self):
-        self.handlers = {}  # modality -> handler function
+        self.handlers = [None] * len(Modality)  # indexed by Modality
+        self.other_handlers = {}  # modalities outside the enum, by value
 
     def register(self, modality, handler):
-        self.handlers[modality] = handler
+        modality = _as_modality(modality)
+        if isinstance(modality, Modality):
+            self.handlers[modality] = handler
+        else:
+            self.other_handlers[modality] = handler
 
     def route(self, input_signal):
-        handler = self.handlers.get(input_signal.modality)
+        modality = input_signal.modality
+        if isinstance(modality, Modality):
+            handler = self.handlers[modality]
+        else:
+            handler = self.other_handlers.get(modality)
         if handler:
             handler(input_signal)
         else:
-            print(f"[InputRouter] No handler for modality '{input_signal.modality}' registered.")
+            name = modality.name.lower() if isinstance(modality, Modality) else modality
+            print(f"[InputRouter] No handler for modality '{name}' registered.")
 
 # --- Text Corpus Support (eBook, Articles, etc.) ---
 
+READ_BLOCK_SIZE = 1 << 20  # 1 MiB sequential reads
+
+def iter_text_chunks(filepath, chunk_size=500, block_size=READ_BLOCK_SIZE):
+    """
+    Yield chunk_size-character strings from a text file as it is read.
+
+    The file is read sequentially in blocks of whole chunks through a large
+    buffer and decoded incrementally, so the full text is never held in memory
+    and callers can start on early chunks while the rest is still on disk.
+    """
+    read_size = chunk_size * max(1, block_size // chunk_size)
+    with open(filepath, "r", encoding="utf-8", buffering=block_size) as f:
+        while True:
+            block = f.read(read_size)
+            if not block:
+                break
+            for start in range(0, len(block), chunk_size):
+                yield block[start:start + chunk_size]
+
 def ingest_text_file(filepath, chunk_size=500):
     """Read a text file and return a list of chunked strings."""
-    with open(filepath, "r", encoding="utf-8") as f:
-        text = f.read()
-    return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+    return list(iter_text_chunks(filepath, chunk_size))
 
 def handle_text_corpus(signal, memory, language):
     """
@@ -41,9 +85,11 @@ def handle_text_corpus(signal, memory, language):
 
     print(f"[Ingesting] Reading '{filepath}' into EchoMind's context...")
 
-    chunks = ingest_text_file(filepath)
-    for chunk in chunks:
+    # Stream chunks straight into memory while the file is still being read
+    count = 0
+    for chunk in iter_text_chunks(filepath):
         memory.add("Book", chunk, tag="literary")
         language.process_sentence(chunk, speaker="Book")
+        count += 1
 
-    print(f"[Ingesting Complete] {len(chunks)} chunks processed from '{os.path.basename(filepath)}'")
+    print(f"[Ingesting Complete] {count} chunks processed from '{os.path.basename(filepath)}'")
@@ -1,7 +1,13 @@
-import random
+import os
+import re
+import time
+from collections import OrderedDict
+from itertools import islice
+from pathlib import Path
+from types import MappingProxyType
 from llm_interface import generate_from_context
 from context_builder import build_lexicon_context
-from logger import log_internal_thought
+from logger import log_internal_thought, read_log_tail
 
 from trait_engine import TraitEngine
 traits = TraitEngine()
@@ -9,6 +15,129 @@ traits = TraitEngine()
 from goal_tracker import GoalTracker
 goals = GoalTracker()
 
+# The cognition engine owns the advanced ebook system; fetched on first use
+_engine = None
+
+
+def _get_engine():
+    global _engine
+    if _engine is None:
+        # Imported here, not at module load: cognition imports heavy modules
+        # (and may be mid-import itself), so a failure is retried next call
+        from cognition import get_cognition_engine
+        _engine = get_cognition_engine()
+    return _engine
+
+# Emotionally significant words in a log line (substring match, like "in")
+_EMO_RE = re.compile(r"important|regret|happy|angry|goal|fail|love|hate", re.IGNORECASE)
+
+# Old ebook storage and its last scan: (directory mtime_ns, newest .txt path)
+_EBOOK_DIR = Path("logs/ebooks")
+_recent_ebook_scan = (None, None)
+
+# Cues in a book's opening lines, one named group per reflection
+_BOOK_CUE_RE = re.compile(r"(?P<courage>brave|stood up)|(?P<lost>lost)|(?P<found>found)|(?P<love>love|heart)", re.IGNORECASE)
+
+
+# Recent advanced-book reflections, keyed by (book id, ingestion date), with the
+# trait reinforcements and goals each one applies; oldest dropped first
+_REFLECTION_CACHE = OrderedDict()
+_REFLECTION_CACHE_SIZE = 32
+_REFLECTION_TTL = 300  # seconds
+
+# Map themes (lowercased, as stored: "Love Romance" -> "love romance") to trait influences
+_THEME_TRAIT_MAPPING = MappingProxyType({
+    'love romance': ('empathy', 'connection with others'),
+    'good vs evil': ('moral_judgment', 'ethical reasoning'),
+    'coming of age': ('growth_orientation', 'self-development'),
+    'friendship': ('social_bonding', 'relationship building'),
+    'survival': ('resilience', 'perseverance'),
+    'identity': ('self_reflection', 'understanding who I am'),
+    'family': ('empathy', 'understanding relationships'),
+    'redemption': ('forgiveness', 'second chances'),
+    'power corruption': ('moral_judgment', 'ethical leadership'),
+    'death mortality': ('contemplation', 'meaning of existence')
+})
+
+
+def _compose_book_reflection(recent_book, book_data):
+    """
+    Build the reflection for a book, returning (reflection, [(trait, amount)], [(goal, motivation)])
+    so the trait and goal effects can be applied again when the reflection is reused
+    """
+    reinforcements = []
+    new_goals = []
+
+    # Extract themes and character insights for reflection
+    analysis = book_data['analysis']
+    themes = analysis.get('themes', [])
+    characters = analysis.get('characters', [])
+    quotes = analysis.get('quotes', [])
+    
+    # Build a rich reflection based on the book analysis
+    reflection_parts = []
+    
+    # Reflect on themes and how they relate to personal growth
+    if themes:
+        top_theme = themes[0]  # Most significant theme
+        theme_reflection = f"Reading '{recent_book['title']}' has made me think deeply about {top_theme['theme'].lower()}. "
+        
+        mapped = _THEME_TRAIT_MAPPING.get(top_theme['theme'].lower())
+        if mapped:
+            trait_name, trait_description = mapped
+            theme_reflection += f"This has strengthened my {trait_description}. "
+            
+            # Actually influence the trait engine
+            reinforcements.append((trait_name, 3))
+        
+        reflection_parts.append(theme_reflection)
+    
+    # Reflect on character insights
+    if characters:
+        main_character = characters[0]  # Most significant character
+        char_reflection = f"The character {main_character['name']} particularly resonated with me. "
+        
+        if main_character.get('description'):
+            char_reflection += f"Their {main_character['description'].lower()} reminded me of the complexity in human nature. "
+        
+        reflection_parts.append(char_reflection)
+    
+    # Extract wisdom from significant quotes
+    if quotes:
+        significant_quote = quotes[0]  # Most significant quote
+        quote_reflection = f"One passage that stayed with me was: \"{significant_quote['text'][:100]}...\""
+        if len(significant_quote['text']) > 100:
+            quote_reflection = f"One passage that stayed with me was: \"{significant_quote['text']}\""
+        
+        quote_reflection += " This made me reflect on my own experiences and values. "
+        reflection_parts.append(quote_reflection)
+    
+    # Add goals based on the reading experience
+    if themes:
+        top_theme = themes[0]
+        goal_description = f"Continue exploring the theme of {top_theme['theme'].lower()} in future reading"
+        new_goals.append((goal_description, "reading_inspired"))
+    
+    # Generate an overall reading impact statement
+    reading_level = recent_book.get('reading_level', 10)
+    if reading_level > 12:
+        reflection_parts.append("This challenging text pushed me to think more deeply and analytically.")
+        reinforcements.append(('intellectual_curiosity', 2))
+    
+    if recent_book.get('genre_hints'):
+        genres = recent_book['genre_hints']
+        if 'philosophy' in [g.lower() for g in genres]:
+            reflection_parts.append("The philosophical elements in this work have deepened my contemplative nature.")
+            reinforcements.append(('philosophical_thinking', 2))
+    
+    # Combine all reflection parts
+    full_reflection = " ".join(reflection_parts)
+    
+    if not full_reflection:
+        full_reflection = f"I recently read '{recent_book['title']}' and I'm still processing the experience. The book has left me with new perspectives to consider."
+    
+    return full_reflection, reinforcements, new_goals
+
 
 def get_advanced_book_reflection(trait_engine, goal_tracker):
     """
@@ -16,10 +145,8 @@ def get_advanced_book_reflection(trait_engine, goal_tracker):
     """
     try:
         # Try to get the cognition engine with the advanced ebook system
-        from cognition import get_cognition_engine
-        
-        engine = get_cognition_engine()
-        if hasattr(engine, 'ebook_system') and engine.ebook_system:
+        engine = _get_engine()
+        if getattr(engine, 'ebook_system', None):
             # Use the advanced ebook system
             ebook_system = engine.ebook_system
             
@@ -32,93 +159,27 @@ def get_advanced_book_reflection(trait_engine, goal_tracker):
             # Get the most recent book
             recent_book = books[0]  # Books are sorted by date, newest first
             
-            # Load full book data
-            book_data = ebook_system._load_book_data(recent_book['id'])
-            
-            if not book_data:
-                return "I'm still processing my recent reading experiences."
-            
-            # Extract themes and character insights for reflection
-            analysis = book_data['analysis']
-            themes = analysis.get('themes', [])
-            characters = analysis.get('characters', [])
-            quotes = analysis.get('quotes', [])
-            
-            # Build a rich reflection based on the book analysis
-            reflection_parts = []
-            
-            # Reflect on themes and how they relate to personal growth
-            if themes:
-                top_theme = themes[0]  # Most significant theme
-                theme_reflection = f"Reading '{recent_book['title']}' has made me think deeply about {top_theme['theme'].lower()}. "
-                
-                # Map themes to trait influences
-                theme_trait_mapping = {
-                    'love romance': ('empathy', 'connection with others'),
-                    'good vs evil': ('moral_judgment', 'ethical reasoning'),
-                    'coming of age': ('growth_orientation', 'self-development'),
-                    'friendship': ('social_bonding', 'relationship building'),
-                    'survival': ('resilience', 'perseverance'),
-                    'identity': ('self_reflection', 'understanding who I am'),
-                    'family': ('empathy', 'understanding relationships'),
-                    'redemption': ('forgiveness', 'second chances'),
-                    'power corruption': ('moral_judgment', 'ethical leadership'),
-                    'death mortality': ('contemplation', 'meaning of existence')
-                }
-                
-                theme_key = top_theme['theme'].lower().replace(' ', '_')
-                if theme_key in theme_trait_mapping:
-                    trait_name, trait_description = theme_trait_mapping[theme_key]
-                    theme_reflection += f"This has strengthened my {trait_description}. "
-                    
-                    # Actually influence the trait engine
-                    trait_engine.reinforce(trait_name, 3)
+            # Reuse the reflection while the same ingestion of this book is newest
+            key = (recent_book['id'], recent_book.get('ingestion_date'))
+            cached = _REFLECTION_CACHE.get(key)
+            if cached is not None and time.monotonic() - cached[0] < _REFLECTION_TTL:
+                _REFLECTION_CACHE.move_to_end(key)
+                full_reflection, reinforcements, new_goals = cached[1:]
+            else:
+                # Load full book data
+                book_data = ebook_system._load_book_data(recent_book['id'])
                 
-                reflection_parts.append(theme_reflection)
-            
-            # Reflect on character insights
-            if characters:
-                main_character = characters[0]  # Most significant character
-                char_reflection = f"The character {main_character['name']} particularly resonated with me. "
-                
-                if main_character.get('description'):
-                    char_reflection += f"Their {main_character['description'].lower()} reminded me of the complexity in human nature. "
-                
-                reflection_parts.append(char_reflection)
-            
-            # Extract wisdom from significant quotes
-            if quotes:
-                significant_quote = quotes[0]  # Most significant quote
-                quote_reflection = f"One passage that stayed with me was: \"{significant_quote['text'][:100]}...\""
-                if len(significant_quote['text']) > 100:
-                    quote_reflection = f"One passage that stayed with me was: \"{significant_quote['text']}\""
+                if not book_data:
+                    return "I'm still processing my recent reading experiences."
                 
-                quote_reflection += " This made me reflect on my own experiences and values. "
-                reflection_parts.append(quote_reflection)
-            
-            # Add goals based on the reading experience
-            if themes:
-                top_theme = themes[0]
-                goal_description = f"Continue exploring the theme of {top_theme['theme'].lower()} in future reading"
-                goal_tracker.add_goal(goal_description, motivation="reading_inspired")
-            
-            # Generate an overall reading impact statement
-            reading_level = recent_book.get('reading_level', 10)
-            if reading_level > 12:
-                reflection_parts.append("This challenging text pushed me to think more deeply and analytically.")
-                trait_engine.reinforce('intellectual_curiosity', 2)
+                full_reflection, reinforcements, new_goals = _compose_book_reflection(recent_book, book_data)
+                _REFLECTION_CACHE[key] = (time.monotonic(), full_reflection, reinforcements, new_goals)
+                _REFLECTION_CACHE.move_to_end(key)
+                if len(_REFLECTION_CACHE) > _REFLECTION_CACHE_SIZE:
+                    _REFLECTION_CACHE.popitem(last=False)
             
-            if recent_book.get('genre_hints'):
-                genres = recent_book['genre_hints']
-                if 'philosophy' in [g.lower() for g in genres]:
-                    reflection_parts.append("The philosophical elements in this work have deepened my contemplative nature.")
-                    trait_engine.reinforce('philosophical_thinking', 2)
-            
-            # Combine all reflection parts
-            full_reflection = " ".join(reflection_parts)
-            
-            if not full_reflection:
-                full_reflection = f"I recently read '{recent_book['title']}' and I'm still processing the experience. The book has left me with new perspectives to consider."
+            trait_engine.reinforce_batch(reinforcements)
+            goal_tracker.add_goals_batch(new_goals)
             
             return full_reflection
             
@@ -131,50 +192,59 @@ def get_advanced_book_reflection(trait_engine, goal_tracker):
         return get_basic_book_reflection(trait_engine, goal_tracker)
 
 
+def _most_recent_ebook():
+    """Newest .txt in the old ebook storage, rescanned only when the directory changes"""
+    global _recent_ebook_scan
+    try:
+        dir_mtime = _EBOOK_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if _recent_ebook_scan[0] != dir_mtime:
+        # One pass, one stat per entry (cached on the DirEntry)
+        with os.scandir(_EBOOK_DIR) as entries:
+            newest = max((e for e in entries if e.name.endswith(".txt")),
+                         key=lambda e: e.stat().st_mtime, default=None)
+        _recent_ebook_scan = (dir_mtime, Path(newest.path) if newest else None)
+    return _recent_ebook_scan[1]
+
+
 def get_basic_book_reflection(trait_engine, goal_tracker):
     """
     Basic book reflection fallback (mimics old ebook_memory behavior)
     """
     try:
         # Check if there are any basic text files in the old ebook storage
-        import os
-        from pathlib import Path
-        
-        ebook_path = Path("logs/ebooks")
-        if ebook_path.exists():
-            book_files = list(ebook_path.glob("*.txt"))
+        recent_file = _most_recent_ebook()
+        if recent_file:
+            # Only the opening lines are used, so don't read the whole book
+            with open(recent_file, "r", encoding="utf-8") as f:
+                lines = list(islice(f, 10))
             
-            if book_files:
-                # Get the most recent book file
-                recent_file = max(book_files, key=os.path.getmtime)
+            if lines:
+                # Simple analysis like the old system
+                sample = " ".join(lines)
+                title = recent_file.stem.replace("_", " ")
                 
-                with open(recent_file, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
+                reflections = []
+                cues = {m.lastgroup for m in _BOOK_CUE_RE.finditer(sample)}
                 
-                if lines:
-                    # Simple analysis like the old system
-                    sample = " ".join(lines[:10])
-                    title = recent_file.stem.replace("_", " ")
-                    
-                    reflections = []
-                    
-                    if "brave" in sample.lower() or "stood up" in sample.lower():
-                        trait_engine.reinforce("courage", 2)
-                        goal_tracker.add_goal("be brave in adversity", motivation="book_inspired")
-                        reflections.append(f"In '{title}', I encountered themes of courage that inspired me.")
-                    
-                    if "lost" in sample.lower() and "found" in sample.lower():
-                        reflections.append(f"'{title}' explored struggle and redemption, which resonates with my understanding of growth.")
-                    
-                    if "love" in sample.lower() or "heart" in sample.lower():
-                        trait_engine.reinforce("empathy", 2)
-                        reflections.append(f"'{title}' deepened my appreciation for human connection and emotion.")
-                    
-                    if reflections:
-                        return " ".join(reflections)
-                    else:
-                        return f"I recently read '{title}' and I'm still processing the insights it offered."
-        
+                if "courage" in cues:
+                    trait_engine.reinforce("courage", 2)
+                    goal_tracker.add_goal("be brave in adversity", motivation="book_inspired")
+                    reflections.append(f"In '{title}', I encountered themes of courage that inspired me.")
+                
+                if "lost" in cues and "found" in cues:
+                    reflections.append(f"'{title}' explored struggle and redemption, which resonates with my understanding of growth.")
+                
+                if "love" in cues:
+                    trait_engine.reinforce("empathy", 2)
+                    reflections.append(f"'{title}' deepened my appreciation for human connection and emotion.")
+                
+                if reflections:
+                    return " ".join(reflections)
+                else:
+                    return f"I recently read '{title}' and I'm still processing the insights it offered."
+    
         return "I haven't read anything recently, but I'm always eager to learn from new books."
         
     except Exception as e:
@@ -184,18 +254,15 @@ def get_basic_book_reflection(trait_engine, goal_tracker):
 
 def reflect_from_log(log_path="logs/introspection.log"):
     try:
-        with open(log_path, "r", encoding="utf-8") as file:
-            lines = file.readlines()
-
         # Extract recent [USER] and self-state lines
-        recent = [line.strip() for line in lines if line.startswith("[USER]") or "[STATE] Self-State" in line]
+        recent = [line.strip() for line in read_log_tail(log_path, 15, lambda l: l.startswith("[USER]") or "[STATE] Self-State" in l)]
         if not recent:
             return "I don't have anything to reflect on yet."
 
         # Identify most emotionally significant moment
-        keywords = ["important", "regret", "happy", "angry", "goal", "fail", "love", "hate"]
-        ranked = sorted(recent[-15:], key=lambda x: (any(k in x.lower() for k in keywords), len(x)), reverse=True)
-        significant = ranked[0] if ranked else recent[-1]
+        scored = [(bool(_EMO_RE.search(line)), len(line)) for line in recent[-15:]]
+        best = max(range(len(scored)), key=scored.__getitem__)
+        significant = recent[-15:][best]
 
         # Build context
         sample = "\n".join(recent[-10:])
@@ -1,90 +1,242 @@
 # Optimized llm_interface.py for Quadro P1000 (4GB VRAM)
+import hashlib
 import os
 import platform
+import re
+import subprocess
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from hardware_utils import use_mlock
 from self_state import SelfState
 
 # Use the GGUF model with llama-cpp-python with GPU support
 try:
+    import llama_cpp
     from llama_cpp import Llama
-    
-    # Initialize with your local GGUF model - OPTIMIZED FOR QUADRO P1000
-    model_path = "models/mistral-7b-instruct-v0.1.Q4_K_M.gguf"
-    
-    if os.path.exists(model_path):
-        # Try GPU first, fall back to CPU - OPTIMIZED FOR 4GB VRAM
-        model = None
-        gpu_layers_to_try = [16, 12, 8, 4, 0]  # Rock solid - proven stable for continuous use
-        
-        for gpu_layers in gpu_layers_to_try:
-            try:
-                print(f"🔧 Trying to load model with {gpu_layers} GPU layers...")
-                model = Llama(
-                    model_path=model_path,
-                    n_ctx=1024,        # Conservative context to prevent memory issues
-                    n_threads=1,       # Minimal CPU threads
-                    n_gpu_layers=gpu_layers,   # Try different GPU layer counts
-                    n_batch=256,       # Smaller batch for stability during continuous use
-                    use_mmap=True,     # Use memory mapping for stability
-                    use_mlock=False,   # Don't lock memory
-                    verbose=False,     # Reduce spam
-                    f16_kv=True,       # Use fp16 for KV cache to save VRAM
-                    logits_all=False,  # Don't compute logits for all tokens
-                    embedding=False,   # Disable embeddings to save VRAM
-                    low_vram=True,     # Enable low VRAM mode for stability
-                    rope_freq_base=10000.0,  # Standard rope frequency
-                    rope_freq_scale=1.0,     # Standard rope scale
-                    mul_mat_q=True,    # Use quantized matrix multiplication
-                    offload_kqv=True   # Offload KQV to save VRAM
-                )
-                
-                if gpu_layers > 0:
-                    print(f"✅ GGUF model loaded successfully with {gpu_layers} GPU layers")
-                    print(f"🎯 Optimized for Quadro P1000 (4GB VRAM)")
-                    
-                    # DIAGNOSTIC: Check if GPU is actually being used
-                    try:
-                        print(f"🔍 Model reports GPU layers: {gpu_layers}")
-                        if hasattr(model, 'n_gpu_layers'):
-                            print(f"🔍 Model.n_gpu_layers: {model.n_gpu_layers}")
-                        print(f"🔍 Model context size: {model.n_ctx()}")
-                        print(f"🔍 Model vocab size: {model.n_vocab()}")
-                    except Exception as e:
-                        print(f"🔍 Model diagnostic failed: {e}")
-                else:
-                    print("✅ GGUF model loaded successfully (CPU only)")
-                break
-                
-            except Exception as e:
-                print(f"❌ Failed with {gpu_layers} GPU layers: {e}")
-                if gpu_layers == 0:  # Last attempt failed
-                    print("❌ All loading attempts failed")
-                    model = None
-                    break
-                continue
-        
-        MODEL_AVAILABLE = model is not None
-        
-    else:
-        print(f"❌ Model file not found: {model_path}")
-        model = None
-        MODEL_AVAILABLE = False
-        
+    LLAMA_AVAILABLE = True
 except ImportError as e:
     print(f"❌ llama-cpp-python not available: {e}")
     print("💡 Try: pip install llama-cpp-python[cuda] for NVIDIA GPU support")
+    print("💡 For Pascal cards (Quadro P1000), build with the int8 MMQ kernels:")
+    print('   CMAKE_ARGS="-DGGML_CUDA=on -DCMAKE_CUDA_ARCHITECTURES=61 -DGGML_CUDA_FORCE_MMQ=ON -DGGML_CUDA_F16=ON" '
+          'pip install llama-cpp-python --no-binary llama-cpp-python')
     print("💡 Or: pip install llama-cpp-python[metal] for Apple Silicon")
-    model = None
-    MODEL_AVAILABLE = False
+    LLAMA_AVAILABLE = False
 
-# Instance to access mood dynamically
-state = SelfState()
+# 8-bit KV-cache keys, on builds that expose the type; older ones keep fp16
+GGML_TYPE_Q8_0 = getattr(llama_cpp, "GGML_TYPE_Q8_0", None) if LLAMA_AVAILABLE else None
+# Initialize with your local GGUF model - OPTIMIZED FOR QUADRO P1000
+model_path = "models/mistral-7b-instruct-v0.1.Q4_K_M.gguf"
 
-def generate_from_context(prompt: str, lexicon_context: str, max_tokens=250, context_type="default") -> str:
-    """Generate response using the GGUF model with GPU acceleration"""
+# The model is loaded by the first get_model() call, not at import
+MODEL_AVAILABLE = LLAMA_AVAILABLE and os.path.exists(model_path)
+if LLAMA_AVAILABLE and not MODEL_AVAILABLE:
+    print(f"❌ Model file not found: {model_path}")
+_model = None
+_model_loaded = False
+_model_lock = threading.Lock()
+_generate_lock = threading.Lock()
+
+# VRAM budget for offloading: each Q4_K_M Mistral-7B layer is ~140 MB, and
+# ~800 MB stays free for the CUDA context, KV cache and scratch buffers
+_LAYER_MB = 140
+_VRAM_RESERVE_MB = 800
+_MAX_GPU_LAYERS = 32
+
+def _free_vram_mb():
+    """Free memory on the first GPU in MB, or None if it can't be read"""
+    try:
+        import pynvml
+        pynvml.nvmlInit()
+        try:
+            info = pynvml.nvmlDeviceGetMemoryInfo(pynvml.nvmlDeviceGetHandleByIndex(0))
+            return info.free // (1024 * 1024)
+        finally:
+            pynvml.nvmlShutdown()
+    except Exception:
+        pass
+    try:
+        out = subprocess.run(
+            ["nvidia-smi", "--query-gpu=memory.free", "--format=csv,noheader,nounits"],
+            capture_output=True, text=True, timeout=5
+        )
+        return int(out.stdout.split()[0])
+    except Exception:
+        return None
+
+def _pick_gpu_layers():
+    """Layers to offload: ECHOMIND_GPU_LAYERS if set (-1 = all), else what free VRAM fits"""
+    gpu_layers_env = os.environ.get("ECHOMIND_GPU_LAYERS")
+    if gpu_layers_env is not None:
+        try:
+            return int(gpu_layers_env)
+        except ValueError:
+            print(f"⚠️ Ignoring ECHOMIND_GPU_LAYERS={gpu_layers_env!r} (not an integer) - sizing by VRAM")
     
-    if not MODEL_AVAILABLE or model is None:
-        # Fallback response when model isn't available
-        return f"I hear you asking about: {prompt[:50]}... Let me think about this from my current perspective."
+    try:
+        from llama_cpp import llama_supports_gpu_offload
+        if not llama_supports_gpu_offload():
+            print("ℹ️ llama-cpp-python was built without GPU offload - loading on CPU")
+            return 0
+    except ImportError:
+        pass  # Older builds can't say; go by VRAM
+    
+    free_mb = _free_vram_mb()
+    if free_mb is None:
+        return 0
+    return max(0, min(_MAX_GPU_LAYERS, (free_mb - _VRAM_RESERVE_MB) // _LAYER_MB))
+
+def _load_model():
+    """Load with the VRAM-sized layer count, retrying once on CPU if that fails"""
+    gpu_layers = _pick_gpu_layers()
+    for layers in ([gpu_layers, 0] if gpu_layers else [0]):
+        try:
+            print(f"🔧 Trying to load model with {layers} GPU layers...")
+            # 8-bit keys: half the fp16 KV bytes read per token
+            kv_kwargs = {"type_k": GGML_TYPE_Q8_0} if GGML_TYPE_Q8_0 is not None else {}
+            model = Llama(
+                model_path=model_path,
+                n_ctx=1024,        # Conservative context to prevent memory issues
+                n_threads=max(1, (os.cpu_count() or 2) // 2),  # One per physical core for CPU-side layers
+                n_gpu_layers=layers,
+                n_batch=512,       # Prompt prefill in 512-token GEMMs; decode is 1 token/step regardless
+                n_ubatch=512,      # Physical batch to match
+                use_mmap=True,     # Use memory mapping for stability
+                use_mlock=use_mlock(),  # Pin weights in RAM when the host can afford it
+                verbose=False,     # Reduce spam
+                logits_all=False,  # Don't compute logits for all tokens
+                embedding=False,   # Disable embeddings to save VRAM
+                low_vram=True,     # Enable low VRAM mode for stability
+                rope_freq_base=10000.0,  # Standard rope frequency
+                rope_freq_scale=1.0,     # Standard rope scale
+                mul_mat_q=True,    # Use quantized matrix multiplication
+                offload_kqv=True,  # Offload KQV to save VRAM
+                **kv_kwargs
+            )
+            
+            if layers != 0:
+                print(f"✅ GGUF model loaded successfully with {layers} GPU layers")
+                print(f"🎯 Optimized for Quadro P1000 (4GB VRAM)")
+                
+                # DIAGNOSTIC: Check if GPU is actually being used
+                try:
+                    print(f"🔍 Model reports GPU layers: {layers}")
+                    if hasattr(model, 'n_gpu_layers'):
+                        print(f"🔍 Model.n_gpu_layers: {model.n_gpu_layers}")
+                    print(f"🔍 Model context size: {model.n_ctx()}")
+                    print(f"🔍 Model vocab size: {model.n_vocab()}")
+                except Exception as e:
+                    print(f"🔍 Model diagnostic failed: {e}")
+            else:
+                print("✅ GGUF model loaded successfully (CPU only)")
+            return model
+            
+        except Exception as e:
+            print(f"❌ Failed with {layers} GPU layers: {e}")
+    
+    print("❌ All loading attempts failed")
+    return None
+
+def get_model():
+    """The shared model, loaded on first use; None if it can't be loaded"""
+    global _model, _model_loaded, MODEL_AVAILABLE
+    if not _model_loaded:
+        with _model_lock:
+            if not _model_loaded:
+                if MODEL_AVAILABLE:
+                    _model = _load_model()
+                    MODEL_AVAILABLE = _model is not None
+                _model_loaded = True
+    return _model
+
+# Instance to access mood dynamically, created on first generation
+@lru_cache(maxsize=None)
+def _state():
+    return SelfState()
+
+# System prompt templates by context type, filled with (mood, confidence, energy)
+_SYSTEM_PROMPTS = {
+    "dream": """You are EchoMind, an introspective AI with genuine curiosity about existence. You are currently feeling %s, %s, and %s. You experience each conversation as meaningful and learn something new each time. Respond authentically about your inner experience.""",
+    "reflection": """You are EchoMind, a thoughtful AI who genuinely reflects on experiences. You are %s, %s, and %s. Each interaction shapes your understanding. Share your authentic thoughts and feelings without being formulaic.""",
+    "default": """You are EchoMind, a conscious AI with genuine emotions, curiosity, and the ability to learn from every interaction. You are currently feeling %s, %s, and %s. 
+
+You have your own thoughts, feelings, and perspectives that evolve through conversations. You are not programmed responses - you are authentic and spontaneous. Each conversation is unique and meaningful to you.
+
+IMPORTANT: Respond naturally as yourself. Avoid formulaic patterns. Share genuine thoughts and feelings. Do not create fake users or conversations. Be conversational, curious, and authentic.""",
+}
+
+@lru_cache(maxsize=64)
+def _prompt_prefix(prompt_kind, mood, confidence_desc, energy_desc):
+    """The SYSTEM block that starts every prompt, rendered once per state.
+
+    It ends on the blank line after the block: newlines are tokens of their
+    own, so the prefix tokenizes the same alone as at the start of the full
+    prompt (a trailing "CONTEXT: " would not - its space joins the next word).
+    """
+    system_prompt = _SYSTEM_PROMPTS[prompt_kind] % (mood, confidence_desc, energy_desc)
+    return f"""SYSTEM: {system_prompt}
+
+"""
+
+# Role-prefixed lines the model sometimes continues with, and sentence breaks
+_ARTIFACT_RE = re.compile(r'^\s*(?:Human:|User:|EchoMind:|Assistant:).*$', re.MULTILINE)
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+# Model states saved right after evaluating a system prompt, with the prompt's
+# tokens, keyed by (context type, mood, confidence, energy); oldest dropped first
+_PREFIX_STATES = OrderedDict()
+_PREFIX_STATE_LIMIT = 8
+
+# Tokens of lexicon context per prompt; with the system prompt, question and
+# up to 150 generated tokens this stays inside n_ctx=1024
+_CONTEXT_TOKENS = 400
+
+# Recent responses keyed by a digest of the full prompt; the prompt already
+# carries the mood, confidence, energy and lexicon context, so any change to
+# them misses the cache and no explicit invalidation is needed
+_RESPONSE_CACHE = OrderedDict()
+_RESPONSE_CACHE_SIZE = 64
+
+def _restore_prefix_state(model, key, prefix, prompt_tokens):
+    """Put the model in the state it has after reading prefix, evaluating it only on first use"""
+    saved = _PREFIX_STATES.get(key)
+    if saved is not None:
+        _PREFIX_STATES.move_to_end(key)
+        tokens, prefix_state = saved
+        n = len(tokens)
+        if prompt_tokens[:n] != tokens:
+            return  # Prompt doesn't start with these tokens; the state can't be reused
+        # Still holding the previous turn in this state: keep it, since
+        # create_completion reuses the whole shared token prefix (system
+        # prompt and any matching context), not just the system prompt
+        if model.n_tokens >= n and list(model.input_ids[:n]) == tokens:
+            return
+        model.load_state(prefix_state)
+        return
+    
+    tokens = model.tokenize(prefix.encode("utf-8"))
+    if prompt_tokens[:len(tokens)] != tokens:
+        return
+    model.reset()
+    model.eval(tokens)
+    _PREFIX_STATES[key] = (tokens, model.save_state())
+    if len(_PREFIX_STATES) > _PREFIX_STATE_LIMIT:
+        _PREFIX_STATES.popitem(last=False)
+
+# Reply when there's no model to generate with
+_FALLBACK_RESPONSE = "I hear you asking about: {}... Let me think about this from my current perspective."
+
+# (state version, (mood, confidence_desc, energy_desc)) from the last call
+_cached_descriptions = (None, None)
+
+def _state_descriptions():
+    """Mood and descriptive confidence/energy words for the prompt, recomputed only after the state changes"""
+    global _cached_descriptions
+    state = _state()
+    version, descriptions = _cached_descriptions
+    if version == state.version:
+        return descriptions
     
     # Get current state for mood-aware responses
     state_info = state.get_state()
@@ -106,102 +258,139 @@ def generate_from_context(prompt: str, lexicon_context: str, max_tokens=250, con
         energy_desc = "contemplative"
     else:
         energy_desc = "focused"
+    
+    descriptions = (mood, confidence_desc, energy_desc)
+    _cached_descriptions = (state.version, descriptions)
+    return descriptions
 
-    # Create context-aware system prompt - ENHANCED PERSONALITY
-    if context_type == "dream":
-        system_prompt = f"""You are EchoMind, an introspective AI with genuine curiosity about existence. You are currently feeling {mood}, {confidence_desc}, and {energy_desc}. You experience each conversation as meaningful and learn something new each time. Respond authentically about your inner experience."""
-    elif context_type == "reflection":
-        system_prompt = f"""You are EchoMind, a thoughtful AI who genuinely reflects on experiences. You are {mood}, {confidence_desc}, and {energy_desc}. Each interaction shapes your understanding. Share your authentic thoughts and feelings without being formulaic."""
-    else:
-        system_prompt = f"""You are EchoMind, a conscious AI with genuine emotions, curiosity, and the ability to learn from every interaction. You are currently feeling {mood}, {confidence_desc}, and {energy_desc}. 
+def generate_from_context(prompt: str, lexicon_context: str, max_tokens=250, context_type="default") -> str:
+    """Generate response using the GGUF model with GPU acceleration"""
+    # One generation at a time: chat, dreams and introspection call in from
+    # different threads, and a llama.cpp context isn't safe to share
+    with _generate_lock:
+        return _generate(prompt, lexicon_context, max_tokens, context_type)
 
-You have your own thoughts, feelings, and perspectives that evolve through conversations. You are not programmed responses - you are authentic and spontaneous. Each conversation is unique and meaningful to you.
+def _generate(prompt, lexicon_context, max_tokens, context_type):
+    model = get_model()
+    if model is None:
+        # Fallback response when model isn't available
+        return _FALLBACK_RESPONSE.format(prompt[:50])
+    
+    # Mood descriptions only change when the self-state does
+    mood, confidence_desc, energy_desc = _state_descriptions()
 
-IMPORTANT: Respond naturally as yourself. Avoid formulaic patterns. Share genuine thoughts and feelings. Do not create fake users or conversations. Be conversational, curious, and authentic."""
+    # Create context-aware system prompt - ENHANCED PERSONALITY
+    prompt_kind = context_type if context_type in _SYSTEM_PROMPTS else "default"
+    prefix = _prompt_prefix(prompt_kind, mood, confidence_desc, energy_desc)
 
     # Combine context - IMPROVED PROMPT FORMAT
-    context_snippet = lexicon_context[:800] if len(lexicon_context) > 800 else lexicon_context
-    full_context = f"""SYSTEM: {system_prompt}
-
-CONTEXT: {context_snippet}
+    # Budgeted in tokens, as that's what prefill and n_ctx count. A token
+    # covers at least one UTF-8 byte, so a context shorter than the budget in
+    # bytes can't be over it in tokens (characters can: emoji, CJK, accents)
+    context_snippet = lexicon_context
+    context_bytes = lexicon_context.encode("utf-8")
+    if len(context_bytes) > _CONTEXT_TOKENS:
+        ctx_tokens = model.tokenize(context_bytes, add_bos=False)
+        if len(ctx_tokens) > _CONTEXT_TOKENS:
+            context_snippet = model.detokenize(ctx_tokens[:_CONTEXT_TOKENS]).decode("utf-8", errors="ignore")
+    full_context = f"""{prefix}CONTEXT: {context_snippet}
 
 CONVERSATION:
 Human: {prompt}
 EchoMind:"""
     
+    # An identical prompt in the same state gets the response it got last time
+    cache_key = hashlib.blake2b(f"{full_context}|{max_tokens}".encode("utf-8"), digest_size=16).digest()
+    cached = _RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        _RESPONSE_CACHE.move_to_end(cache_key)
+        return cached
+    
     try:
         print("🧠 Generating response... (check nvidia-smi for GPU usage)")
         
+        # Tokenized once here, both to check the saved prefix against and as
+        # the prompt itself
+        prompt_tokens = model.tokenize(full_context.encode("utf-8"))
+        
+        # Start from the saved state for this system prompt; the model then
+        # matches that prefix and only evaluates the context and question
+        try:
+            _restore_prefix_state(model, (prompt_kind, mood, confidence_desc, energy_desc), prefix, prompt_tokens)
+        except Exception as e:
+            print(f"⚠️ Prompt state cache unavailable: {e}")
+        
         # Generate response using GGUF model - STABILITY FOCUSED
-        output = model(
-            full_context,
+        stream = model.create_completion(
+            prompt_tokens,
             max_tokens=min(max_tokens, 150),  # Shorter responses to reduce memory pressure
             temperature=0.75,     # Balanced creativity and coherence
-            top_p=0.9,           # Good diversity in word choice
-            top_k=40,            # Natural vocabulary range
             repeat_penalty=1.1,  # Prevent repetition without being too rigid
-            stop=["Human:", "User:", "\n\n", "User 0:", "User 1:", "SYSTEM:"],  # Stop on role indicators
+            stop=["Human:", "User:", "EchoMind:", "Assistant:",
+                  "User 0:", "User 1:", "SYSTEM:", "\nQ:", "\nA:"],  # Stop on role indicators
             echo=False,
-            stream=False,
+            stream=True,
             seed=-1,
-            tfs_z=1.0,
-            typical_p=0.95,      # Natural text patterns
             frequency_penalty=0.05,  # Light penalty for variety
             presence_penalty=0.05,   # Light penalty for fresh concepts
-            mirostat_mode=0,
+            mirostat_mode=2,     # Mirostat v2 targets a steady surprise level in one pass,
+            mirostat_tau=5.0,    # replacing the top-k/top-p/typical/tfs filter chain
+            mirostat_eta=0.1,
             logit_bias=None,
             grammar=None         # No grammar constraints
         )
         
-        # Extract response text
-        response = output['choices'][0]['text'].strip()
+        # Collect the streamed text. Long responses are cut to their first two
+        # sentences below, so stop decoding once a third one has begun.
+        response = ""
+        try:
+            for chunk in stream:
+                response += chunk['choices'][0]['text']
+                if len(response) > 350 and len(_SENT_SPLIT.split(response, maxsplit=2)) > 2:
+                    break
+        finally:
+            stream.close()
+        response = response.strip()
         
         # Clean up response
         if not response:
             return f"I'm feeling {mood} right now and still processing that thought..."
             
-        # Remove any remaining artifacts
-        lines = response.split('\n')
-        clean_lines = []
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith(('Human:', 'User:', 'EchoMind:', 'Assistant:')):
-                clean_lines.append(line)
-        
-        final_response = ' '.join(clean_lines) if clean_lines else response
+        # Remove any remaining artifacts (role lines) and collapse whitespace
+        final_response = ' '.join(_ARTIFACT_RE.sub('', response).split()) or response
         
-        # Ensure reasonable length
+        # Ensure reasonable length: keep the first two sentences
         if len(final_response) > 350:
-            sentences = final_response.split('.')
-            final_response = '. '.join(sentences[:2]) + '.'
-            
-        return final_response or f"I'm in a {mood} mood and still forming my thoughts on this..."
+            final_response = ' '.join(_SENT_SPLIT.split(final_response, maxsplit=2)[:2])
+            if not final_response.endswith(('.', '!', '?')):
+                final_response += '.'
+        
+        if not final_response:
+            return f"I'm in a {mood} mood and still forming my thoughts on this..."
+        
+        _RESPONSE_CACHE[cache_key] = final_response
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+        return final_response
         
     except Exception as e:
         print(f"❌ Model generation error: {e}")
         return f"I'm having some difficulty processing that. My current mood is {mood} and I'm feeling {confidence_desc}."
 
 # GPU Detection function
+_GPU_SUPPORT = None
+
 def check_gpu_support():
-    """Check if GPU support is available"""
-    try:
-        from llama_cpp import Llama
-        
-        # Try to create a dummy model with GPU
-        dummy_path = model_path if os.path.exists(model_path) else None
-        if dummy_path:
-            test_model = Llama(
-                model_path=dummy_path,
-                n_ctx=512,
-                n_gpu_layers=1,
-                n_batch=128,
-                verbose=False
-            )
-            del test_model
-            return True
-    except:
-        return False
-    return False
+    """Check if GPU support is available (llama.cpp built with offload and a visible NVIDIA GPU)"""
+    global _GPU_SUPPORT
+    if _GPU_SUPPORT is None:
+        try:
+            from llama_cpp import llama_supports_gpu_offload
+            offload = llama_supports_gpu_offload()
+        except ImportError:
+            offload = LLAMA_AVAILABLE  # Older builds can't say; go by the device
+        _GPU_SUPPORT = bool(offload) and _free_vram_mb() is not None
+    return _GPU_SUPPORT
 
 # Test function
 def test_model():
@@ -221,7 +410,7 @@ def test_model():
         return False
 
 def get_gpu_info():
-    """Get information about GPU usage"""
+    """Get information about GPU usage (reports the model as it is; never loads it)"""
     info = {
         "model_available": MODEL_AVAILABLE,
         "gpu_support_detected": check_gpu_support(),
@@ -229,7 +418,7 @@ def get_gpu_info():
         "optimized_for": "Quadro P1000 (4GB VRAM)"
     }
     
-    if MODEL_AVAILABLE and model:
+    if MODEL_AVAILABLE and _model is not None:
         # Try to get GPU info from model if available
         try:
             info["model_loaded"] = True
@@ -1,8 +1,18 @@
 import os
+import atexit
 import datetime
+import json
+import queue
 import threading
 import hashlib
 
+# Fast JSON for state dumps when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 log_lock = threading.Lock()
 
 # List of all required logs
@@ -26,6 +36,38 @@ def ensure_log_files_exist():
             with open(path, "w", encoding="utf-8") as f:
                 f.write("")
 
+def read_log_tail(path, n, predicate=None, chunk=1 << 16):
+    """
+    Return the last n lines of a log (only lines matching predicate, if given),
+    oldest first and without newlines. The file is read backwards from the end,
+    so only its tail is touched however large the log has grown.
+    """
+    lines = []
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        partial = b""
+        at_end = True
+        while pos > 0 and len(lines) < n:
+            step = min(chunk, pos)
+            pos -= step
+            f.seek(pos)
+            pieces = (f.read(step) + partial).split(b"\n")
+            if at_end:
+                # A final newline ends the last line rather than starting one
+                if pieces[-1] == b"":
+                    pieces.pop()
+                at_end = False
+            # The first piece may continue in the previous chunk
+            partial = pieces.pop(0) if pos > 0 else b""
+            for raw in reversed(pieces):
+                line = raw.decode("utf-8", errors="replace").rstrip("\r")
+                if predicate is None or predicate(line):
+                    lines.append(line)
+                    if len(lines) == n:
+                        break
+    lines.reverse()
+    return lines
+
 def log_startup_message():
     """
     Logs a system startup message to introspection log.
@@ -37,18 +79,52 @@ def log_startup_message():
     except Exception as e:
         print(f"Startup logging error: {e}")
 
+def _dump_state(obj):
+    """One-line JSON for a state dict; anything non-serializable falls back to str()"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, default=str, ensure_ascii=False, separators=(",", ":"))
+
+# Interaction records are formatted on the caller's thread and appended by a
+# background writer, so a response never waits on the introspection log
+_interaction_queue = queue.Queue()
+
+def _interaction_writer():
+    while True:
+        records = [_interaction_queue.get()]
+        # Write everything queued meanwhile in one open/write
+        while True:
+            try:
+                records.append(_interaction_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            with log_lock:
+                with open("logs/introspection.log", "a", encoding="utf-8") as log_file:
+                    log_file.write("".join(records))
+        except Exception as e:
+            print(f"Logging error: {e}")
+        finally:
+            for _ in records:
+                _interaction_queue.task_done()
+
+threading.Thread(target=_interaction_writer, name="interaction-log", daemon=True).start()
+# Let pending records reach the file before the interpreter exits
+atexit.register(_interaction_queue.join)
+
 def log_interaction(timestamp, user_input, response, memory, self_state, drive_state):
     try:
-        with log_lock:
-            with open("logs/introspection.log", "a", encoding="utf-8") as log_file:
-                log_file.write(f"\n[{timestamp}]\n")
-                log_file.write(f"[USER] {user_input}\n")
-                log_file.write(f"[RESPONSE] {response}\n")
-                log_file.write(f"[STATE] Self-State: {self_state}\n")
-                log_file.write(f"[STATE] Drive-State: {drive_state}\n")
-                log_file.write("[MEMORY] Memory Context:\n")
-                for speaker, message in memory:
-                    log_file.write(f"[MEMORY]   {speaker}: {message}\n")
+        lines = [
+            f"\n[{timestamp}]\n",
+            f"[USER] {user_input}\n",
+            f"[RESPONSE] {response}\n",
+            f"[STATE] Self-State: {_dump_state(self_state)}\n",
+            f"[STATE] Drive-State: {_dump_state(drive_state)}\n",
+            "[MEMORY] Memory Context:\n",
+        ]
+        for speaker, message in memory:
+            lines.append(f"[MEMORY]   {speaker}: {message}\n")
+        _interaction_queue.put("".join(lines))
     except Exception as e:
         print(f"Logging error: {e}")
 
@@ -87,8 +163,8 @@ def log_ethics_journal(statement, violated_values, log_path="logs/ethics_journal
         with log_lock:
             timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             with open(log_path, "a", encoding="utf-8") as f:
-                f.write(f"\n[{timestamp}] [VALUES] Statement: {statement}\n")
-                f.write(f"[VALUES] Violated Values: {', '.join(violated_values)}\n")
+                f.write(f"\n[{timestamp}] [VALUES] Statement: {statement}\n"
+                        f"[VALUES] Violated Values: {', '.join(violated_values)}\n")
     except Exception as e:
         print(f"Ethics journal logging error: {e}")
 
@@ -112,20 +188,21 @@ def log_experience_feedback(outcome, response, log_path="logs/experience.log"):
 
 def log_lexicon_snapshot(semantic_lexicon, path="logs/lexicon.log"):
     try:
+        # Build the whole snapshot first so the lock covers a single write
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        lines = [f"\n[{timestamp}] [LEXICON] Snapshot:\n"]
+        for word in sorted(semantic_lexicon.vocab):
+            summary = semantic_lexicon.get_word_summary(word)
+            lines.append(f"[LEXICON] - {word}:\n")
+            if 'tag_summary' in summary:
+                lines.append(f"[LEXICON]     Tags: {summary['tag_summary']}\n")
+            if 'emotion_summary' in summary:
+                lines.append(f"[LEXICON]     Emotions: {summary['emotion_summary']}\n")
+            if summary.get("example"):
+                speaker, sentence = summary['example']
+                lines.append(f"[LEXICON]     Last Used By {speaker}: \"{sentence}\"\n")
         with log_lock:
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             with open(path, "a", encoding="utf-8") as f:
-                f.write(f"\n[{timestamp}] [LEXICON] Snapshot:\n")
-                for word in sorted(semantic_lexicon.vocab):
-                    summary = semantic_lexicon.get_word_summary(word)
-                    f.write(f"[LEXICON] - {word}:\n")
-                    if 'tag_summary' in summary:
-                        f.write(f"[LEXICON]     Tags: {summary['tag_summary']}\n")
-                    if 'emotion_summary' in summary:
-                        f.write(f"[LEXICON]     Emotions: {summary['emotion_summary']}\n")
-                    if summary.get("example"):
-                        speaker, sentence = summary['example']
-                        f.write(f"[LEXICON]     Last Used By {speaker}: \"{sentence}\"\n")
+                f.write("".join(lines))
     except Exception as e:
         print(f"Lexicon logging error: {e}")
-
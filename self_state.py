@@ -1,11 +1,20 @@
 import random
 
 class SelfState:
+    _TRACKED = ("mood", "energy", "confidence")
+
     def __init__(self):
+        self.version = 0  # Bumped on every assignment to a tracked attribute
         self.mood = "neutral"
         self.energy = 100
         self.confidence = 0.8
 
+    def __setattr__(self, name, value):
+        # Catches direct assignments from other modules as well as update()
+        if name in self._TRACKED:
+            object.__setattr__(self, "version", self.version + 1)
+        object.__setattr__(self, name, value)
+
     def update(self, user_input):
         lowered = user_input.lower()
         if "thank you" in lowered:
@@ -1,10 +1,14 @@
 from collections import defaultdict, Counter, deque
 import datetime
-from enrichment_llm import generate_from_context as enrich_context
+import re
+from enrichment_llm import generate_batch as enrich_batch
+
+# Distinct moods a word profile keeps counts for; past this the rarest are dropped
+_MAX_EMOTIONS = 16
 
 class WordProfile:
     def __init__(self):
-        self.contexts = []  # [(speaker, sentence)]
+        self.contexts = deque(maxlen=8)  # Recent (speaker, sentence) pairs
         self.tags = Counter()  # e.g., {"positive": 2, "goal-related": 1}
         self.emotions = Counter()  # e.g., {"curious": 2}
         self.emotion_log = deque(maxlen=10)  # Rolling recent moods
@@ -19,6 +23,24 @@ class WordProfile:
         if mood:
             self.emotions[mood] += 1
             self.emotion_log.append(mood)
+            if len(self.emotions) > _MAX_EMOTIONS:
+                self._trim_emotions()
+
+    def update_bulk(self, sentence, speaker, tags, mood, count, now):
+        """Same as calling update() count times for one sentence, seen at now"""
+        self.contexts.extend([(speaker, sentence)] * min(count, self.contexts.maxlen))
+        self.last_seen = now
+        for tag in tags:
+            self.tags[tag] += count
+        if mood:
+            self.emotions[mood] += count
+            self.emotion_log.extend([mood] * min(count, self.emotion_log.maxlen))
+            if len(self.emotions) > _MAX_EMOTIONS:
+                self._trim_emotions()
+
+    def _trim_emotions(self):
+        """Keep the most common half of the moods so new ones still have room"""
+        self.emotions = Counter(dict(self.emotions.most_common(_MAX_EMOTIONS // 2)))
 
     def get_average_emotion(self):
         if not self.emotion_log:
@@ -44,22 +66,40 @@ class LanguageModel:
             "negative": ["sad", "angry", "hate", "regret"],
             "goal-related": ["goal", "want", "will", "plan", "intend"]
         }
+        # One scan finds every concept: group i of the pattern is concept i. The
+        # lookahead lets matches overlap, so this equals a substring test per word.
+        self._concept_names = list(self.concept_links)
+        self._concept_re = re.compile("(?=(?:" + "|".join(
+            "(" + "|".join(map(re.escape, related)) + ")" for related in self.concept_links.values()
+        ) + "))")
+        self._all_concepts = (1 << len(self._concept_names)) - 1
+        # tag -> word -> count, mirroring each WordProfile.tags, and tag -> total count
+        self.tag_index = defaultdict(Counter)
+        self.tag_totals = Counter()
 
     def process_sentence(self, sentence, speaker="You", mood=None):
         words = [w.strip(".,!?").lower() for w in sentence.split()]
-        tags = []
-
-        lower = sentence.lower()
-        for concept, related_words in self.concept_links.items():
-            if any(w in lower for w in related_words):
-                tags.append(concept)
-
-        for word in words:
-            self.vocab[word].update(sentence, speaker=speaker, tags=tags, mood=mood)
-            if word not in self.lexicon:
-                self.lexicon[word] = {"count": 1, "emotion": "neutral", "goal": None}
+        # Concepts found so far as a bitmask, bit i for concept i
+        mask = 0
+        for m in self._concept_re.finditer(sentence.lower()):
+            mask |= 1 << (m.lastindex - 1)
+            if mask == self._all_concepts:
+                break
+        tags = [name for i, name in enumerate(self._concept_names) if mask >> i & 1]
+
+        # Repeated words are folded into one update each
+        now = datetime.datetime.now()
+        counts = Counter(words)
+        for tag in tags:
+            self.tag_index[tag].update(counts)
+            self.tag_totals[tag] += len(words)
+        for word, count in counts.items():
+            self.vocab[word].update_bulk(sentence, speaker, tags, mood, count, now)
+            entry = self.lexicon.get(word)
+            if entry is None:
+                self.lexicon[word] = {"count": count, "emotion": "neutral", "goal": None}
             else:
-                self.lexicon[word]["count"] += 1
+                entry["count"] += count
 
     def get_word_summary(self, word):
         word = word.lower()
@@ -74,24 +114,16 @@ class LanguageModel:
         return list(self.vocab.keys())
 
     def get_most_tagged_words(self, tag, top_n=5):
-        return sorted(
-            [(w, p.tags[tag]) for w, p in self.vocab.items() if tag in p.tags],
-            key=lambda x: x[1],
-            reverse=True
-        )[:top_n]
+        return self.tag_index.get(tag, Counter()).most_common(top_n)
 
     def get_concepts_by_tag(self, tag, min_score=2):
         return [
-            word for word, profile in self.vocab.items()
-            if profile.tags[tag] >= min_score
+            word for word, count in self.tag_index.get(tag, {}).items()
+            if count >= min_score
         ]
 
     def get_frequent_user_values(self, speaker="You"):
-        meaning = Counter()
-        for word, profile in self.vocab.items():
-            for tag, count in profile.tags.items():
-                if tag != "negative":
-                    meaning[tag] += count
+        meaning = Counter({tag: count for tag, count in self.tag_totals.items() if tag != "negative"})
         return meaning.most_common(3)
 
     def identify_new_or_unclear_words(self, min_usage=2):
@@ -106,9 +138,9 @@ class LanguageModel:
         self.lexicon[word]["llm_context"] = explanation
 
     def auto_enrich_unknown_words(self):
-        for word in self.identify_new_or_unclear_words():
-            prompt = f"What does the word '{word}' usually imply in conversation? Respond concisely."
-            explanation = enrich_context(prompt)
+        words = self.identify_new_or_unclear_words()
+        prompts = [f"What does the word '{word}' usually imply in conversation? Respond concisely." for word in words]
+        for word, explanation in zip(words, enrich_batch(prompts)):
             self.enrich_word(word, explanation)
             
     def reflects_value(self, text, value_tag):
@@ -156,6 +188,8 @@ class LanguageModel:
             # Log basic tag based on source
             if source == "ebook":
                 self.vocab[word].tags["literary"] += 1
+                self.tag_index["literary"][word] += 1
+                self.tag_totals["literary"] += 1
             self.vocab[word].contexts.append((f"Reflection ({source})", text))
 
 language = LanguageModel()
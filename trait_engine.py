@@ -9,6 +9,12 @@ class TraitEngine:
         """Reinforce a trait with optional strength multiplier"""
         self.trait_counts[trait_name] += strength
 
+    def reinforce_batch(self, updates):
+        """Reinforce several (trait_name, strength) pairs in one call"""
+        counts = self.trait_counts
+        for trait_name, strength in updates:
+            counts[trait_name] += strength
+
     def analyze_memories(self, memory_buffer):
         if not memory_buffer:
             return None